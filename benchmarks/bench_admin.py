@@ -0,0 +1,55 @@
+"""
+Render the admin changelist of a model holding a RegisterField, with the plain
+ModelAdmin and with the RegisterAdminMixin.
+"""
+
+# Django
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.test import RequestFactory
+
+# django_register
+from django_register import RegisterField
+from django_register.admin import RegisterAdminMixin
+
+# Local
+from . import urls
+from .utils import create_model, make_register
+
+SIZES = (10, 1_000, 100_000)
+ROWS = (1_000,)
+
+
+class PlainAdmin(admin.ModelAdmin):
+    list_display = ("id", "member")
+    list_per_page = 100
+
+
+class MixinAdmin(RegisterAdminMixin, PlainAdmin):
+    pass
+
+
+def _changelist(model_admin):
+    request = RequestFactory().get("/")
+    request.user = User(is_active=True, is_staff=True, is_superuser=True)
+    return model_admin.changelist_view(request).render()
+
+
+def run(suite):
+    for size in suite.get_sizes(SIZES):
+        register = make_register(size)
+        members = list(register)
+
+        for count in suite.get_rows(ROWS):
+            for admin_class in (PlainAdmin, MixinAdmin):
+                model = create_model("Admin", member=RegisterField(register=register))
+                model.objects.bulk_create(
+                    model(member=members[i % size]) for i in range(count)
+                )
+                urls.register(model, admin_class)
+                model_admin = urls.site.get_model_admin(model)
+                params = {"admin": admin_class.__name__, "size": size, "rows": count}
+
+                suite.bench(
+                    "admin.changelist", lambda: _changelist(model_admin), **params
+                )
@@ -0,0 +1,57 @@
+"""
+Import time of a project defining many RegisterChoices classes, and the cost
+of the first use of one of them. The sizes are the number of members of each
+class, the rows the number of classes.
+"""
+
+# Local
+from .utils import Member
+
+SIZES = (10, 50)
+ROWS = (500,)
+
+
+def _build_source(classes, members):
+    lines = [
+        "from django_register import RegisterChoices",
+        "from benchmarks.utils import Member",
+    ]
+
+    for i in range(classes):
+        lines.append(f"class Choices{i}(RegisterChoices):")
+        lines.extend(
+            f"    MEMBER_{j} = Member('member_{j}', 'Member {j}', {j}, {j % 97})"
+            for j in range(members)
+        )
+
+    return compile("\n".join(lines), "<choices>", "exec")
+
+
+def _define(code):
+    namespace = {"Member": Member}
+    exec(code, namespace)  # noqa: S102
+    return namespace
+
+
+def _define_and_use(code, count):
+    namespace = _define(code)
+    return [namespace[f"Choices{i}"].choices for i in range(count)]
+
+
+def run(suite):
+    for size in suite.get_sizes(SIZES):
+        for count in suite.get_rows(ROWS):
+            code = _build_source(count, size)
+            params = {"members": size, "classes": count}
+
+            suite.bench("choices.import", lambda: _define(code), **params)
+            suite.bench(
+                "choices.import_and_use_one",
+                lambda: _define(code)["Choices0"].choices,
+                **params,
+            )
+            suite.bench(
+                "choices.import_and_use_all",
+                lambda: _define_and_use(code, count),
+                **params,
+            )
@@ -0,0 +1,40 @@
+"""
+Compare converting values one at a time with Register.get_class and
+Register.get_key against the batch methods.
+"""
+
+# Local
+from .utils import make_register
+
+SIZES = (10, 1_000, 100_000)
+ROWS = (100_000,)
+
+
+def run(suite):
+    for size in suite.get_sizes(SIZES):
+        register = make_register(size)
+        members = list(register)
+
+        for count in suite.get_rows(ROWS):
+            objects = [members[i % size] for i in range(count)]
+            keys = [member.key for member in objects]
+            params = {"size": size, "rows": count}
+
+            suite.bench(
+                "conversions.get_class_loop",
+                lambda: [register.get_class(key) for key in keys],
+                **params,
+            )
+            suite.bench(
+                "conversions.get_classes",
+                lambda: register.get_classes(keys),
+                **params,
+            )
+            suite.bench(
+                "conversions.get_key_loop",
+                lambda: [register.get_key(obj) for obj in objects],
+                **params,
+            )
+            suite.bench(
+                "conversions.get_keys", lambda: register.get_keys(objects), **params
+            )
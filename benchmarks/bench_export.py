@@ -0,0 +1,69 @@
+"""
+Export rows with a register field and two of its attributes to CSV: with
+the Exporter, against writing the loaded model instances with csv.writer.
+"""
+
+# Standard libraries
+import csv
+import io
+
+# Django
+from django.db import models
+
+# django_register
+from django_register import RegisterField
+from django_register.export import Exporter
+
+# Local
+from .utils import create_model, make_register
+
+SIZES = (10, 1_000)
+ROWS = (100_000,)
+
+
+def _export_instances(model):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    register = model._meta.get_field("member").register
+
+    for obj in model.objects.all().iterator(chunk_size=2_000):
+        member = obj.member
+        writer.writerow(
+            [
+                obj.title,
+                register.get_key(member),
+                register.get_label(member),
+                member.weight,
+            ]
+        )
+
+    return buffer.getvalue()
+
+
+def _export(model):
+    exporter = Exporter(
+        model.objects.all(),
+        ["title", "member"],
+        attributes={"member": ["label", "weight"]},
+    )
+    return b"".join(exporter.iter_csv(header=False))
+
+
+def run(suite):
+    for size in suite.get_sizes(SIZES):
+        register = make_register(size)
+        members = list(register)
+
+        for count in suite.get_rows(ROWS):
+            model = create_model(
+                "Export",
+                title=models.CharField(max_length=20),
+                member=RegisterField(register=register),
+            )
+            model.objects.bulk_create(
+                model(title=f"row {i}", member=members[i % size]) for i in range(count)
+            )
+            params = {"size": size, "rows": count}
+
+            suite.bench("export.instances", lambda: _export_instances(model), **params)
+            suite.bench("export.exporter", lambda: _export(model), **params)
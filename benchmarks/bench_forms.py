@@ -0,0 +1,36 @@
+"""
+Validate a ModelForm holding a RegisterField and an IntegerRegisterField.
+"""
+
+# Django
+from django import forms
+
+# django_register
+from django_register import IntegerRegisterField, RegisterField
+
+# Local
+from .utils import create_model, make_register
+
+SIZES = (10, 1_000, 100_000)
+NUMBER = 100
+
+
+def run(suite):
+    for size in suite.get_sizes(SIZES):
+        register = make_register(size)
+        target = list(register)[size // 2]
+
+        for field_class, value in (
+            (RegisterField, target.key),
+            (IntegerRegisterField, target.db_id),
+        ):
+            model = create_model("Form", member=field_class(register=register))
+            form_class = forms.modelform_factory(model, fields=["member"])
+            params = {"field": field_class.__name__, "size": size}
+
+            suite.bench(
+                "forms.is_valid",
+                lambda: form_class(data={"member": value}).is_valid(),
+                number=NUMBER,
+                **params,
+            )
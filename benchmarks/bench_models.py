@@ -0,0 +1,95 @@
+"""
+ORM round-trips of the RegisterField and IntegerRegisterField: bulk_create
+(including building the instances), building instances from the field
+default, converting the database values with from_db_value over large
+querysets, against reading the keys with RawKeys and fetching the raw column,
+and loading model instances with eager or lazy fields.
+"""
+
+# Django
+from django.db import connection
+
+# django_register
+from django_register import IntegerRegisterField, RawKeys, RegisterField
+
+# Local
+from .utils import create_model, make_register
+
+SIZES = (10, 1_000, 100_000)
+ROWS = (10_000,)
+
+
+def _fetch_raw(model, count):
+    column = model._meta.get_field("member").column
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {column} FROM {model._meta.db_table} LIMIT %s", [count])
+        return cursor.fetchall()
+
+
+def run(suite):
+    for size in suite.get_sizes(SIZES):
+        register = make_register(size)
+        members = list(register)
+
+        for field_class in (RegisterField, IntegerRegisterField):
+            for count in suite.get_rows(ROWS):
+                model = create_model("Rows", member=field_class(register=register))
+                values = [members[i % size] for i in range(count)]
+                params = {"field": field_class.__name__, "size": size, "rows": count}
+
+                suite.bench(
+                    "models.bulk_create",
+                    lambda: model.objects.bulk_create(
+                        model(member=value) for value in values
+                    ),
+                    **params,
+                )
+
+                default_model = create_model(
+                    "Defaults",
+                    member=field_class(register=register, default=members[-1]),
+                    member_callable=field_class(
+                        register=register, default=lambda: members[-1]
+                    ),
+                )
+                suite.bench(
+                    "models.instantiate_default",
+                    lambda: [default_model() for _ in range(count)],
+                    **params,
+                )
+
+                queryset = model.objects.values_list("member", flat=True)[:count]
+                suite.bench(
+                    "models.from_db_value", lambda: list(queryset.all()), **params
+                )
+                raw_queryset = model.objects.values_list(RawKeys("member"), flat=True)
+                suite.bench(
+                    "models.raw_keys",
+                    lambda: list(raw_queryset[:count].iterator(chunk_size=2_000)),
+                    **params,
+                )
+                suite.bench(
+                    "models.raw_column", lambda: _fetch_raw(model, count), **params
+                )
+
+                lazy_model = create_model(
+                    "Lazy", member=field_class(register=register, lazy=True)
+                )
+                lazy_model.objects.bulk_create(
+                    lazy_model(member=value) for value in values
+                )
+                for name, loaded in (("eager", model), ("lazy", lazy_model)):
+                    instances = loaded.objects.all()[:count]
+                    suite.bench(
+                        "models.load_instances",
+                        lambda: list(instances.all()),
+                        mode=name,
+                        **params,
+                    )
+                    suite.bench(
+                        "models.load_and_read",
+                        lambda: [obj.member for obj in instances.all()],
+                        mode=name,
+                        **params,
+                    )
@@ -0,0 +1,49 @@
+"""
+Registering objects: one register() call at a time (as the decorator and
+AppConfig.ready do), within batch(), and one at a time with a lookup between
+each, which makes every registration copy the register.
+"""
+
+# django_register
+from django_register import Register
+
+# Local
+from .utils import Member
+
+SIZES = (1_000, 8_000)
+
+
+def _members(size):
+    return [Member(f"member_{i}", f"Member {i}", i, i % 97) for i in range(size)]
+
+
+def _one_by_one(members):
+    register = Register()
+    for member in members:
+        register.register(member)
+
+
+def _batch(members):
+    register = Register()
+    with register.batch():
+        for member in members:
+            register.register(member)
+
+
+def _with_lookups(members):
+    register = Register()
+    for member in members:
+        register.register(member)
+        register.get_class(member.key)
+
+
+def run(suite):
+    for size in suite.get_sizes(SIZES):
+        members = _members(size)
+        params = {"size": size}
+
+        suite.bench("registration.one_by_one", lambda: _one_by_one(members), **params)
+        suite.bench("registration.batch", lambda: _batch(members), **params)
+        suite.bench(
+            "registration.with_lookups", lambda: _with_lookups(members), **params
+        )
@@ -0,0 +1,106 @@
+"""
+Serialise many rows with the DRF RegisterField using `keys`, against building
+every representation from scratch. The `defaults` members have no key or label
+attributes, so those are derived from the register.
+
+Validate many=True payloads with the default ListSerializer and with the
+RegisterListSerializer, to measure the cost of its check of all the keys.
+"""
+
+# Standard libraries
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+# Rest Framework
+from rest_framework import serializers
+
+# django_register
+from django_register import Register
+from django_register.rest_framework import RegisterField, RegisterListSerializer
+
+# Local
+from .utils import make_register
+
+SIZES = (10, 1_000)
+ROWS = (5_000,)
+KEYS = ("key", "label", "weight")
+
+
+@dataclass(unsafe_hash=True)
+class Plain:
+    weight: int
+
+
+def make_plain_register(size):
+    register = Register()
+
+    with register.batch():
+        for i in range(size):
+            register.register(Plain(weight=i), db_key=f"member_{i}")
+
+    return register
+
+
+def run(suite):
+    for size in suite.get_sizes(SIZES):
+        for count in suite.get_rows(ROWS):
+            run_representation(suite, size, count)
+            run_validation(suite, size, count)
+
+
+def run_representation(suite, size, count):
+    for members, register_factory in (
+        ("attributes", make_register),
+        ("defaults", make_plain_register),
+    ):
+        register = register_factory(size)
+        values = list(register)
+        rows = [SimpleNamespace(member=values[i % size]) for i in range(count)]
+        params = {"members": members, "size": size, "rows": count}
+
+        class RowSerializer(serializers.Serializer):
+            member = RegisterField(register=register, keys=KEYS)
+
+        field = RowSerializer().fields["member"]
+
+        suite.bench(
+            "serializers.build_loop",
+            lambda: [field._build_representation(row.member) for row in rows],
+            **params,
+        )
+        suite.bench(
+            "serializers.to_representation_loop",
+            lambda: [field.to_representation(row.member) for row in rows],
+            **params,
+        )
+        suite.bench(
+            "serializers.many",
+            lambda: RowSerializer(rows, many=True).data,
+            **params,
+        )
+
+
+def run_validation(suite, size, count):
+    register = make_register(size)
+    keys = register.get_keys(register)
+    data = [{"member": keys[i % size]} for i in range(count)]
+    params = {"size": size, "rows": count}
+
+    for name, list_serializer_class in (
+        ("list_serializer", serializers.ListSerializer),
+        ("register_list_serializer", RegisterListSerializer),
+    ):
+
+        class ItemSerializer(serializers.Serializer):
+            member = RegisterField(register=register)
+
+            class Meta:
+                pass
+
+        ItemSerializer.Meta.list_serializer_class = list_serializer_class
+
+        suite.bench(
+            f"serializers.validate.{name}",
+            lambda: ItemSerializer(data=data, many=True).is_valid(raise_exception=True),
+            **params,
+        )
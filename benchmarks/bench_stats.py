@@ -0,0 +1,41 @@
+"""
+Cost of the lookup statistics: get_class and from_db_value before enabling
+them, while they are enabled, and after disabling them again.
+"""
+
+# django_register
+from django_register import RegisterField
+
+# Local
+from .utils import create_model, make_register
+
+SIZES = (10, 1_000)
+ROWS = (10_000,)
+
+
+def run(suite):
+    for size in suite.get_sizes(SIZES):
+        register = make_register(size)
+        members = list(register)
+        model = create_model("Stats", member=RegisterField(register=register))
+
+        for count in suite.get_rows(ROWS):
+            keys = [members[i % size].key for i in range(count)]
+            model.objects.bulk_create(model(member=key) for key in keys)
+            queryset = model.objects.values_list("member", flat=True)[:count]
+
+            for state in ("before", "enabled", "disabled"):
+                if state == "enabled":
+                    register.enable_stats()
+                elif state == "disabled":
+                    register.disable_stats()
+
+                params = {"stats": state, "size": size, "rows": count}
+                suite.bench(
+                    "stats.get_class_loop",
+                    lambda: [register.get_class(key) for key in keys],
+                    **params,
+                )
+                suite.bench(
+                    "stats.from_db_value", lambda: list(queryset.all()), **params
+                )
@@ -0,0 +1,68 @@
+"""
+Compare the RegisterField (VARCHAR key) with the IntegerRegisterField
+(INTEGER id): index size and lookup speed.
+"""
+
+# Django
+from django.db import connection
+
+# django_register
+from django_register import IntegerRegisterField, RegisterField
+
+# Local
+from .utils import create_model, make_register
+
+SIZES = (10, 1_000)
+ROWS = (20_000,)
+
+
+def _page_count():
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA page_count")
+        return cursor.fetchone()[0]
+
+
+def _index_size(model):
+    column = model._meta.get_field("member").column
+    before = _page_count()
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE INDEX {model._meta.db_table}_idx "
+            f"ON {model._meta.db_table} ({column})"
+        )
+        cursor.execute("PRAGMA page_size")
+        page_size = cursor.fetchone()[0]
+
+    return (_page_count() - before) * page_size
+
+
+def run(suite):
+    for size in suite.get_sizes(SIZES):
+        for count in suite.get_rows(ROWS):
+            run_storage(suite, size, count)
+
+
+def run_storage(suite, size, count):
+    register = make_register(size)
+    members = list(register)
+
+    for field_class in (RegisterField, IntegerRegisterField):
+        model = create_model("Storage", member=field_class(register=register))
+        model.objects.bulk_create(model(member=members[i % size]) for i in range(count))
+        params = {"field": field_class.__name__, "size": size, "rows": count}
+
+        suite.record("storage.index_size", _index_size(model), "bytes", **params)
+
+        target = members[size // 2]
+        suite.bench(
+            "storage.filter_count",
+            lambda: model.objects.filter(member=target).count(),
+            number=20,
+            **params,
+        )
+        suite.bench(
+            "storage.load_all",
+            lambda: list(model.objects.all()),
+            **params,
+        )
@@ -0,0 +1,73 @@
+"""
+Lookups from several threads at once, while another thread keeps registering
+objects. On free-threaded CPython builds the readers run in parallel, as they
+never take a lock.
+"""
+
+# Standard libraries
+import itertools
+import sys
+import threading
+import time
+from dataclasses import dataclass
+
+# Local
+from .utils import make_register
+
+SIZES = (10, 1_000)
+ROWS = (100_000,)
+THREADS = (1, 2, 4, 8)
+
+_extra_counter = itertools.count()
+
+
+@dataclass(unsafe_hash=True)
+class Extra:
+    key: str
+
+
+def _lookups(register, keys):
+    get_class = register.get_class
+    for key in keys:
+        get_class(key)
+
+
+def _run_threads(register, keys, threads):
+    done = threading.Event()
+
+    def write():
+        while not done.is_set():
+            register.register(Extra(f"extra_{next(_extra_counter)}"))
+            time.sleep(0.001)
+
+    writer = threading.Thread(target=write)
+    readers = [
+        threading.Thread(target=_lookups, args=(register, keys)) for _ in range(threads)
+    ]
+
+    writer.start()
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
+    done.set()
+    writer.join()
+
+
+def run(suite):
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+    for size in suite.get_sizes(SIZES):
+        for count in suite.get_rows(ROWS):
+            for threads in THREADS:
+                register = make_register(size)
+                members = list(register)
+                keys = [members[i % size].key for i in range(count)]
+                params = {"gil": gil, "threads": threads, "size": size, "rows": count}
+
+                # Each thread does `rows` lookups.
+                suite.bench(
+                    "threads.get_class",
+                    lambda: _run_threads(register, keys, threads),
+                    **params,
+                )
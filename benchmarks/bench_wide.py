@@ -0,0 +1,64 @@
+"""
+Convert members with many fields, as the hash and equality of a dataclass
+go through all of them: get_prep_value on the registered objects themselves,
+and on equal copies of them.
+"""
+
+# Standard libraries
+import copy
+from dataclasses import make_dataclass
+
+# django_register
+from django_register import IntegerRegisterField, Register, RegisterField
+
+SIZES = (10, 1_000)
+ROWS = (100_000,)
+FIELDS = (4, 32)
+
+
+def make_wide_register(size, fields):
+    member_class = make_dataclass(
+        f"Wide{fields}",
+        [("key", str), ("db_id", int)] + [(f"field_{i}", str) for i in range(fields)],
+        unsafe_hash=True,
+    )
+    register = Register()
+
+    with register.batch():
+        for i in range(size):
+            register.register(
+                member_class(f"member_{i}", i, *(f"value_{j}" for j in range(fields)))
+            )
+
+    return register
+
+
+def run(suite):
+    for size in suite.get_sizes(SIZES):
+        for fields in FIELDS:
+            register = make_wide_register(size, fields)
+            members = list(register)
+
+            for count in suite.get_rows(ROWS):
+                objects = [members[i % size] for i in range(count)]
+                copies = [copy.copy(obj) for obj in objects]
+
+                for field_class in (RegisterField, IntegerRegisterField):
+                    field = field_class(register=register)
+                    params = {
+                        "field": field_class.__name__,
+                        "size": size,
+                        "fields": fields,
+                        "rows": count,
+                    }
+
+                    suite.bench(
+                        "wide.get_prep_value",
+                        lambda: [field.get_prep_value(obj) for obj in objects],
+                        **params,
+                    )
+                    suite.bench(
+                        "wide.get_prep_value_copy",
+                        lambda: [field.get_prep_value(obj) for obj in copies],
+                        **params,
+                    )
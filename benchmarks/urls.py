@@ -0,0 +1,16 @@
+# Django
+from django.contrib.admin import AdminSite
+from django.urls import clear_url_caches, path
+
+site = AdminSite(name="benchmarks")
+
+urlpatterns = []
+
+
+def register(model, admin_class):
+    """
+    Register a model built by a benchmark and rebuild the admin urls.
+    """
+    site.register(model, admin_class)
+    urlpatterns[:] = [path("admin/", site.urls)]
+    clear_url_caches()
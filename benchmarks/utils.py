@@ -0,0 +1,107 @@
+# Standard libraries
+import itertools
+import json
+import timeit
+from dataclasses import dataclass
+
+# Django
+from django.db import connection, models
+
+# django_register
+from django_register import Register
+
+_model_counter = itertools.count()
+
+
+@dataclass(unsafe_hash=True)
+class Member:
+    key: str
+    label: str
+    db_id: int
+    weight: int
+
+
+def make_register(size, **kwargs):
+    register = Register(**kwargs)
+
+    with register.batch():
+        for i in range(size):
+            register.register(
+                Member(key=f"member_{i}", label=f"Member {i}", db_id=i, weight=i % 97)
+            )
+
+    return register
+
+
+def create_model(name, **fields):
+    """
+    Build a throwaway model and create its table, so each benchmark can use
+    its own register sizes.
+    """
+    name = f"{name}{next(_model_counter)}"
+    attrs = {
+        "__module__": __name__,
+        "Meta": type("Meta", (), {"app_label": "benchmarks"}),
+    }
+    model = type(name, (models.Model,), {**attrs, **fields})
+
+    with connection.schema_editor() as editor:
+        editor.create_model(model)
+
+    return model
+
+
+class Suite:
+    """
+    Collect the results of the benchmarks. `sizes` and `rows` override the
+    register sizes and row counts each benchmark module uses by default.
+    """
+
+    def __init__(self, repeat=5, sizes=None, rows=None):
+        self.repeat = repeat
+        self.sizes = sizes
+        self.rows = rows
+        self.results = []
+
+    def get_sizes(self, default):
+        return self.sizes or default
+
+    def get_rows(self, default):
+        return self.rows or default
+
+    def bench(self, name, func, number=1, **params):
+        """
+        Time `func` and record the best time of a single call.
+        """
+        seconds = min(timeit.repeat(func, number=number, repeat=self.repeat)) / number
+        return self.record(name, seconds, "s", **params)
+
+    def record(self, name, value, unit, **params):
+        self.results.append(
+            {"name": name, "params": params, "value": value, "unit": unit}
+        )
+
+        shown = f"{value * 1e6:.2f} us" if unit == "s" else f"{value} {unit}"
+        params = ", ".join(f"{k}={v}" for k, v in params.items())
+        print(f"{name:<40} {params:<55} {shown:>15}")
+        return value
+
+
+def compare(results, baseline):
+    """
+    Print how each result moved against the same benchmark, with the same
+    parameters, in `baseline`.
+    """
+    previous = {
+        (result["name"], json.dumps(result["params"], sort_keys=True)): result
+        for result in baseline
+    }
+
+    for result in results:
+        key = (result["name"], json.dumps(result["params"], sort_keys=True))
+        if key not in previous or not previous[key]["value"]:
+            continue
+
+        ratio = result["value"] / previous[key]["value"]
+        params = ", ".join(f"{k}={v}" for k, v in result["params"].items())
+        print(f"{result['name']:<40} {params:<55} {ratio:>14.2f}x")
@@ -1,4 +1,21 @@
 # Local
-from .base import Register, RegisterChoices, RegisterField
+from .base import (
+    IntegerRegisterField,
+    Register,
+    RegisterChoices,
+    RegisterField,
+    RegisterSetField,
+    SmallIntegerRegisterField,
+)
+from .expressions import RawKeys, RegisterAttribute
 
-__all__ = ["Register", "RegisterChoices", "RegisterField"]
+__all__ = [
+    "IntegerRegisterField",
+    "RawKeys",
+    "Register",
+    "RegisterAttribute",
+    "RegisterChoices",
+    "RegisterField",
+    "RegisterSetField",
+    "SmallIntegerRegisterField",
+]
@@ -0,0 +1,57 @@
+# Django
+from django.core.exceptions import FieldDoesNotExist
+
+# Local
+from .base import RegisterFieldMixin
+
+
+class RegisterAdminMixin:
+    """
+    ModelAdmin mixin displaying the RegisterField columns of the changelist
+    with the register's label map. Django otherwise builds a dict out of the
+    field's flatchoices for every cell it renders.
+    """
+
+    def get_list_display(self, request):
+        list_display = super().get_list_display(request)
+        return [self._get_register_display(name) for name in list_display]
+
+    def get_list_display_links(self, request, list_display):
+        list_display_links = super().get_list_display_links(request, list_display)
+
+        if not list_display_links:
+            return list_display_links
+
+        return [self._get_register_display(name) for name in list_display_links]
+
+    def _get_register_display(self, name):
+        if not isinstance(name, str) or name in self.list_editable:
+            return name
+
+        try:
+            field = self.opts.get_field(name)
+        except FieldDoesNotExist:
+            return name
+
+        if not isinstance(field, RegisterFieldMixin):
+            return name
+
+        # Keep the same callable for each field so it can be matched against
+        # the list_display_links.
+        displays = self.__dict__.setdefault("_register_displays", {})
+        if name not in displays:
+            displays[name] = self._build_register_display(field)
+
+        return displays[name]
+
+    def _build_register_display(self, field):
+        register = field.register
+        attname = field.attname
+
+        def display(obj):
+            return register.get_label(getattr(obj, attname))
+
+        display.__name__ = field.name
+        display.short_description = field.verbose_name
+        display.admin_order_field = field.name
+        return display
@@ -1,12 +1,74 @@
+import importlib
+import itertools
+import sys
+import threading
+import time
 import warnings
+import weakref
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from operator import attrgetter
+from types import MappingProxyType
 
 # Django
+from django import forms
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.deconstruct import deconstructible
+from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 
+from .descriptors import RegisterDescriptor
+from .lookups import (
+    BitmaskContains,
+    BitmaskContainsAll,
+    BitmaskContainsAny,
+    RegisterLabelTransform,
+    RegisterMemberTransform,
+)
 from .settings import settings
+from .stats import RegisterStats, _registers
+
+_MISSING = object()
+
+# Counts and warnings of the unknown keys past REGISTER_FIELD_UNKNOWN_TRACKED_KEYS.
+UNKNOWN_OTHER = "<other>"
+
+
+def _probe(mapping, value):
+    """
+    Look a value up in one of the register dictionaries without raising.
+    Unhashable values can never be registered, so they are simply missing.
+    """
+    try:
+        return mapping.get(value, _MISSING)
+    except TypeError:
+        return _MISSING
+
+
+def _import_path(path):
+    """
+    Import the object at "module:attribute", or at a dotted path.
+    """
+    module_path, _sep, attribute = path.partition(":")
+    if not attribute:
+        return import_string(path)
+
+    obj = importlib.import_module(module_path)
+    try:
+        for name in attribute.split("."):
+            obj = getattr(obj, name)
+    except AttributeError as err:
+        raise ImportError(
+            'Module "%s" does not define "%s"' % (module_path, attribute)
+        ) from err
+
+    return obj
+
+
+def _module_name(path):
+    module_path, sep, _attribute = path.partition(":")
+    return module_path if sep else path.rpartition(".")[0]
 
 
 class UnknownRegisterItem:
@@ -20,16 +82,176 @@ class UnknownRegisterItem:
         return f"<Unknown register key: {getattr(self, settings.KEY_NAME)}>"
 
 
+class _Snapshot:
+    """
+    The registered objects of a register at one version. A published snapshot
+    is not modified: registering changes a copy, which is then published in a
+    single assignment, so readers never see a registration half done and do
+    not need a lock. The views derived from it are cached on it.
+    """
+
+    def __init__(self, previous=None):
+        if previous is None:
+            self.key_to_class = {}
+            self.class_to_key = {}
+            # id(member) -> (member, key), checked before class_to_key as
+            # hashing and comparing wide members is slow. Unhashable members
+            # are only found here.
+            self.identity = {}
+            self.id_to_key = {}
+            self.key_to_id = {}
+            # Objects registered by path, imported on their first lookup.
+            # key -> path, and the registration order of all the keys.
+            self.lazy = {}
+            self.labels = {}
+            self.order = {}
+            # attribute -> (unique, {value: member or tuple of members})
+            self.indexes = {}
+            self.version = 0
+        else:
+            self.key_to_class = dict(previous.key_to_class)
+            self.class_to_key = dict(previous.class_to_key)
+            self.identity = dict(previous.identity)
+            self.id_to_key = dict(previous.id_to_key)
+            self.key_to_id = dict(previous.key_to_id)
+            self.lazy = dict(previous.lazy)
+            self.labels = dict(previous.labels)
+            self.order = dict(previous.order)
+            self.indexes = {
+                attribute: (unique, dict(index))
+                for attribute, (unique, index) in previous.indexes.items()
+            }
+            self.version = previous.version + 1
+
+        self.cache = {}
+        self.cache_generation = settings.generation
+        # Set when key_to_class needs to be put back in registration order.
+        self.unordered = False
+
+    def find_key(self, value):
+        """
+        Return the key of a registered object, or _MISSING. The object itself
+        is found by identity, an equal copy of it by hash and equality.
+        """
+        entry = self.identity.get(id(value))
+        if entry is not None and entry[0] is value:
+            return entry[1]
+
+        return _probe(self.class_to_key, value)
+
+
+def _snapshot_attribute(name):
+    return property(attrgetter("_snapshot." + name))
+
+
 @deconstructible
 class Register:
+    _key_to_class = _snapshot_attribute("key_to_class")
+    _class_to_key = _snapshot_attribute("class_to_key")
+    _identity = _snapshot_attribute("identity")
+    _id_to_key = _snapshot_attribute("id_to_key")
+    _key_to_id = _snapshot_attribute("key_to_id")
+    _lazy = _snapshot_attribute("lazy")
+    _labels = _snapshot_attribute("labels")
+    _order = _snapshot_attribute("order")
+    _indexes = _snapshot_attribute("indexes")
+    # Changes with every registration, derived views are cached per version.
+    version = _snapshot_attribute("version")
+
     def __init__(self, unknown_item_class=None):
-        self._key_to_class = {}
-        self._class_to_key = {}
+        # The last published snapshot. Readers get it through _snapshot, which
+        # records that it was handed out (see __getattr__).
+        self._published = _Snapshot()
+        # The snapshot being built by the thread registering, if any.
+        self._pending = None
+        self._lock = threading.RLock()
+        self._lazy_modules = 0
+        self._unknown_lock = threading.Lock()
+        self._unknown_items = OrderedDict()
+        # When each tracked unknown key was last warned about.
+        self._unknown_warned = {}
+        self.unknown_counts = Counter()
         self.unknown_item_class = unknown_item_class or UnknownRegisterItem
+        self._fields = weakref.WeakValueDictionary()
+        self._stats = None
+
+    def __getstate__(self):
+        # Locks cannot be copied, the copy gets its own.
+        state = self.__dict__.copy()
+        del state["_lock"], state["_unknown_lock"]
+        state.pop("_snapshot", None)
+        state["_pending"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+        self._unknown_lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name != "_snapshot":
+            raise AttributeError(name)
+
+        # First read since the last registration: the snapshot is handed out
+        # from now on, so the next registration copies it instead of changing
+        # it in place.
+        with self._lock:
+            snapshot = self._snapshot = self._published
+        return snapshot
+
+    @contextmanager
+    def _writing(self, copy=False):
+        """
+        Give the snapshot to modify, published when the outermost block exits
+        without error. Nested blocks, and batch(), share the same snapshot.
+
+        The published snapshot is copied if a reader may hold it, or if
+        `copy` is set so that an error publishes nothing. Otherwise it is
+        changed in place, which keeps registering one object at a time cheap;
+        the writers then check everything before changing anything.
+        """
+        with self._lock:
+            if self._pending is not None:
+                yield self._pending
+                return
+
+            if copy or "_snapshot" in self.__dict__:
+                pending = _Snapshot(self._published)
+            else:
+                pending = self._published
+                pending.version += 1
+                pending.cache = {}
+
+            self._pending = pending
+            try:
+                yield pending
+                if pending.unordered:
+                    # Keep the registration order, for the choices.
+                    pending.key_to_class = {
+                        k: pending.key_to_class[k]
+                        for k in pending.order
+                        if k in pending.key_to_class
+                    }
+                    pending.unordered = False
+
+                self._published = pending
+                self.__dict__.pop("_snapshot", None)
+            finally:
+                self._pending = None
+
+    @contextmanager
+    def batch(self):
+        """
+        Register many objects at once. The register is copied once, and the
+        objects are published together when the block exits (and not at all
+        if it raises).
+        """
+        with self._writing(copy=True):
+            yield self
 
-    def register(self, klass=None, db_key=None):
+    def register(self, klass=None, db_key=None, db_id=None):
         if klass is None:
-            return lambda k: self.register(k, db_key=db_key)
+            return lambda k: self.register(k, db_key=db_key, db_id=db_id)
 
         if db_key is None:
             try:
@@ -42,72 +264,695 @@ class Register:
                     ).format(klass=klass, key=settings.KEY_NAME)
                 )
 
-        if db_key in self._key_to_class:
-            raise ValueError(_("Key {key} already registered.").format(key=db_key))
+        if db_id is None:
+            db_id = getattr(klass, settings.ID_NAME, None)
+
+        with self._writing() as snapshot:
+            if db_key in snapshot.key_to_class or db_key in snapshot.lazy:
+                raise ValueError(_("Key {key} already registered.").format(key=db_key))
+
+            try:
+                registered = klass in snapshot.class_to_key
+            except TypeError:
+                registered = id(klass) in snapshot.identity
+
+            if registered:
+                raise ValueError(
+                    _("Class {klass} already registered.").format(klass=klass)
+                )
+
+            self._check_id(snapshot, db_id, klass)
+
+            for attribute, (unique, index) in snapshot.indexes.items():
+                if unique and self._get_index_value(klass, attribute) in index:
+                    raise ValueError(
+                        _("Value {value} of {attribute} already registered.").format(
+                            value=getattr(klass, attribute), attribute=attribute
+                        )
+                    )
+
+            if db_id is not None:
+                snapshot.id_to_key[db_id] = db_key
+                snapshot.key_to_id[db_key] = db_id
+
+            snapshot.key_to_class[db_key] = klass
+            snapshot.identity[id(klass)] = (klass, db_key)
+            try:
+                snapshot.class_to_key[klass] = db_key
+            except TypeError:
+                # Unhashable, only found by identity.
+                pass
+            snapshot.order[db_key] = None
+
+            for attribute, (unique, index) in snapshot.indexes.items():
+                self._add_to_index(index, unique, attribute, klass)
+
+        return klass
+
+    def unregister(self, db_key):
+        """
+        Remove the object (or lazy entry) registered under db_key. The values
+        still holding the key are then given the unknown_item_class.
+        """
+        with self._writing() as snapshot:
+            if db_key in snapshot.lazy:
+                del snapshot.lazy[db_key]
+            elif db_key in snapshot.key_to_class:
+                klass = snapshot.key_to_class.pop(db_key)
+                del snapshot.identity[id(klass)]
+                try:
+                    del snapshot.class_to_key[klass]
+                except TypeError:
+                    pass
+
+                for attribute, (unique, index) in snapshot.indexes.items():
+                    self._remove_from_index(index, unique, attribute, klass)
+            else:
+                raise ValueError(_("Key {key} not registered.").format(key=db_key))
+
+            db_id = snapshot.key_to_id.pop(db_key, None)
+            if db_id is not None:
+                del snapshot.id_to_key[db_id]
+
+            snapshot.labels.pop(db_key, None)
+            del snapshot.order[db_key]
+
+    def _check_id(self, snapshot, db_id, klass):
+        if db_id is None:
+            return
+
+        if not isinstance(db_id, int) or isinstance(db_id, bool):
+            raise ValueError(
+                _("The id {db_id} of {klass} must be an integer.").format(
+                    db_id=db_id, klass=klass
+                )
+            )
+
+        if db_id in snapshot.id_to_key:
+            raise ValueError(_("Id {id} already registered.").format(id=db_id))
+
+    def register_lazy(self, path, db_key, label=None, db_id=None):
+        """
+        Register the object at `path` ("module:attribute") under db_key
+        without importing it. The key, label and id are available right away,
+        the object is imported the first time it is looked up.
+        """
+        with self._writing() as snapshot:
+            if db_key in snapshot.key_to_class or db_key in snapshot.lazy:
+                raise ValueError(_("Key {key} already registered.").format(key=db_key))
+
+            self._check_id(snapshot, db_id, path)
+
+            if db_id is not None:
+                snapshot.id_to_key[db_id] = db_key
+                snapshot.key_to_id[db_key] = db_id
+
+            if label is not None:
+                snapshot.labels[db_key] = label
+
+            snapshot.lazy[db_key] = path
+            snapshot.order[db_key] = None
+
+    def load_lazy(self):
+        """
+        Import all the objects registered by path.
+        """
+        if not self._lazy:
+            return
+
+        # Imported before locking, as the modules may register in turn.
+        imported = [(key, _import_path(path)) for key, path in self._lazy.items()]
+
+        with self._writing():
+            for key, klass in imported:
+                self._resolve_lazy(key, klass)
+
+    def _resolve_lazy(self, key, klass=_MISSING):
+        if klass is _MISSING:
+            path = self._lazy.get(key, _MISSING)
+            if path is _MISSING:
+                # Resolved by another thread since the key was looked up.
+                return self.from_key(key)
+            klass = _import_path(path)
+
+        with self._writing() as snapshot:
+            path = snapshot.lazy.get(key, _MISSING)
+            if path is _MISSING:
+                # Resolved by another thread in the meantime.
+                return self.from_key(key)
+
+            del snapshot.lazy[key]
+            db_id = snapshot.key_to_id.pop(key, None)
+            if db_id is not None:
+                del snapshot.id_to_key[db_id]
 
-        if klass in self._class_to_key:
-            raise ValueError(_("Class {klass} already registered.").format(klass=klass))
+            try:
+                self.register(klass, db_key=key, db_id=db_id)
+            except BaseException:
+                snapshot.lazy[key] = path
+                if db_id is not None:
+                    snapshot.id_to_key[db_id] = key
+                    snapshot.key_to_id[key] = db_id
+                raise
 
-        self._key_to_class[db_key] = klass
-        self._class_to_key[klass] = db_key
+            snapshot.unordered = True
 
         return klass
 
+    def _resolve_imported(self):
+        """
+        Resolve the lazy entries whose module was imported since, as their
+        objects can now be given directly. Return whether any was resolved.
+        """
+        if len(sys.modules) == self._lazy_modules:
+            return False
+        self._lazy_modules = len(sys.modules)
+
+        imported = []
+        for key, path in self._lazy.items():
+            if _module_name(path) in sys.modules:
+                try:
+                    imported.append((key, _import_path(path)))
+                except ImportError:
+                    # The module may still be importing, try again later.
+                    continue
+
+        if not imported:
+            return False
+
+        resolved = False
+        with self._writing() as snapshot:
+            for key, klass in imported:
+                if key not in snapshot.lazy:
+                    # Resolved by another thread in the meantime.
+                    continue
+
+                try:
+                    self._resolve_lazy(key, klass)
+                except ValueError:
+                    # The object cannot be registered under its key (it already
+                    # is under another one, for example). The entry stays lazy
+                    # and the error is raised by the lookups of that key only.
+                    continue
+                resolved = True
+
+        return resolved
+
+    def _get_lazy(self, value):
+        if _probe(self._lazy, value) is not _MISSING:
+            return self._resolve_lazy(value)
+
+        if self._resolve_imported() and self.has_class(value):
+            return value
+
+        return _MISSING
+
+    def index_by(self, attribute, unique=True):
+        """
+        Index the registered objects by one of their attributes, to find them
+        with get_by. The index is kept up to date by register().
+        """
+        with self._writing() as snapshot:
+            if attribute in snapshot.indexes:
+                if snapshot.indexes[attribute][0] != unique:
+                    raise ValueError(
+                        _("The register is already indexed by {attribute}.").format(
+                            attribute=attribute
+                        )
+                    )
+                return
+
+            index = {}
+            for klass in snapshot.key_to_class.values():
+                if unique and self._get_index_value(klass, attribute) in index:
+                    raise ValueError(
+                        _("Value {value} of {attribute} is not unique.").format(
+                            value=getattr(klass, attribute), attribute=attribute
+                        )
+                    )
+                self._add_to_index(index, unique, attribute, klass)
+
+            snapshot.indexes[attribute] = (unique, index)
+
+    def get_by(self, attribute, value, default=None):
+        """
+        Return the object with that attribute value, or a tuple of the objects
+        having it if the index is not unique. The lazy entries are imported
+        first, as their objects are only indexed once imported.
+        """
+        if self._lazy:
+            self.load_lazy()
+
+        try:
+            unique, index = self._indexes[attribute]
+        except KeyError:
+            raise ValueError(
+                _("The register is not indexed by {attribute}.").format(
+                    attribute=attribute
+                )
+            )
+
+        found = _probe(index, value)
+        if found is _MISSING:
+            return default if unique else ()
+
+        return found
+
+    def _get_index_value(self, klass, attribute):
+        value = getattr(klass, attribute, _MISSING)
+
+        try:
+            hash(value)
+        except TypeError:
+            # Unhashable values cannot be looked up, they are not indexed.
+            return _MISSING
+
+        return value
+
+    def _add_to_index(self, index, unique, attribute, klass):
+        value = self._get_index_value(klass, attribute)
+
+        if value is _MISSING:
+            return
+
+        index[value] = klass if unique else index.get(value, ()) + (klass,)
+
+    def _remove_from_index(self, index, unique, attribute, klass):
+        value = self._get_index_value(klass, attribute)
+
+        if value is _MISSING:
+            return
+
+        if unique:
+            del index[value]
+            return
+
+        members = tuple(member for member in index[value] if member is not klass)
+        if members:
+            index[value] = members
+        else:
+            del index[value]
+
+    @property
+    def unknown_item_class(self):
+        return self._unknown_item_class
+
+    @unknown_item_class.setter
+    def unknown_item_class(self, value):
+        self._unknown_item_class = value
+        self._unknown_items.clear()
+        self._unknown_warned.clear()
+
     def from_key(self, value, ignore_warning=False):
+        snapshot = self._snapshot
         try:
-            return self._key_to_class[value]
+            return snapshot.key_to_class[value]
         except (KeyError, TypeError):
-            if not ignore_warning and not isinstance(value, self.unknown_item_class):
-                warnings.warn(
-                    _(
-                        "Value {value} is not registered. The unknown_item_class will be used to return the value."
-                    ).format(value=value)
-                )
-            obj = self.unknown_item_class()
-            setattr(obj, settings.KEY_NAME, value)
-            return obj
+            if snapshot.lazy and _probe(snapshot.lazy, value) is not _MISSING:
+                return self._resolve_lazy(value)
+            return self._get_unknown_item(value, ignore_warning)
 
-    def from_class(self, value):
+    def _get_unknown_item(self, value, ignore_warning):
+        """
+        Unknown items are cached per key, so a stale key found on many rows
+        only builds one item. The keys are counted in unknown_counts and
+        warned about once, the warning being repeated after
+        REGISTER_FIELD_UNKNOWN_WARNING_INTERVAL seconds, if set. Both are kept
+        apart from the cache of items, for up to
+        REGISTER_FIELD_UNKNOWN_TRACKED_KEYS keys; the keys past that are
+        counted and warned about together, as UNKNOWN_OTHER.
+        """
+        with self._unknown_lock:
+            tracked = self._track_unknown(value)
+            warned_at = self._unknown_warned.get(tracked)
+            interval = settings.UNKNOWN_WARNING_INTERVAL
+
+            if warned_at is None or (
+                interval is not None and time.monotonic() - warned_at >= interval
+            ):
+                warned_at = self._warn_unknown(value, ignore_warning)
+                if warned_at is not None:
+                    self._unknown_warned[tracked] = warned_at
+
+            try:
+                obj = self._unknown_items[value]
+            except TypeError:
+                # Unhashable values cannot be cached.
+                return self._build_unknown_item(value)
+            except KeyError:
+                obj = self._unknown_items[value] = self._build_unknown_item(value)
+                while len(self._unknown_items) > settings.UNKNOWN_CACHE_SIZE:
+                    self._unknown_items.popitem(last=False)
+            else:
+                self._unknown_items.move_to_end(value)
+
+        return obj
+
+    def _track_unknown(self, value):
+        counts = self.unknown_counts
         try:
-            return self._class_to_key[value]
-        except KeyError:
+            if value not in counts and len(counts) >= settings.UNKNOWN_TRACKED_KEYS:
+                value = UNKNOWN_OTHER
+            counts[value] += 1
+        except TypeError:
+            value = UNKNOWN_OTHER
+            counts[value] += 1
+
+        return value
+
+    def _build_unknown_item(self, value):
+        obj = self.unknown_item_class()
+        setattr(obj, settings.KEY_NAME, value)
+        return obj
+
+    def _warn_unknown(self, value, ignore_warning):
+        if ignore_warning or isinstance(value, self.unknown_item_class):
+            return None
+
+        warnings.warn(
+            _(
+                "Value {value} is not registered. The unknown_item_class will be used to return the value."
+            ).format(value=value)
+        )
+        return time.monotonic()
+
+    def from_class(self, value):
+        key = self._snapshot.find_key(value)
+        if key is _MISSING and self._lazy and self._resolve_imported():
+            key = self._snapshot.find_key(value)
+
+        if key is _MISSING:
             raise ValidationError(
                 _("Value {value} not a registered class.").format(value=value)
             )
 
+        return key
+
+    def from_id(self, value, ignore_warning=False):
+        snapshot = self._snapshot
+        key = _probe(snapshot.id_to_key, value)
+        if key is _MISSING:
+            return self.from_key(value, ignore_warning=ignore_warning)
+
+        try:
+            return snapshot.key_to_class[key]
+        except KeyError:
+            return self.from_key(key, ignore_warning=ignore_warning)
+
+    def has_key(self, value):
+        snapshot = self._snapshot
+        if _probe(snapshot.key_to_class, value) is not _MISSING:
+            return True
+
+        return bool(snapshot.lazy) and _probe(snapshot.lazy, value) is not _MISSING
+
+    def has_class(self, value):
+        return self._snapshot.find_key(value) is not _MISSING
+
     def get_key(self, value):
-        obj = self.from_key(value, ignore_warning=True)
+        if value is None:
+            return value
 
-        if value is not None and isinstance(obj, self.unknown_item_class):
-            return self.from_class(value)
+        snapshot = self._snapshot
+        entry = snapshot.identity.get(id(value))
+        if entry is not None and entry[0] is value:
+            return entry[1]
 
-        return value
+        if _probe(snapshot.key_to_class, value) is not _MISSING:
+            return value
+
+        key = _probe(snapshot.class_to_key, value)
+        if key is not _MISSING:
+            return key
+
+        if snapshot.lazy and _probe(snapshot.lazy, value) is not _MISSING:
+            return value
+
+        # Not registered at all, let from_class build the error.
+        return self.from_class(value)
+
+    def has_id(self, value):
+        return _probe(self._snapshot.id_to_key, value) is not _MISSING
+
+    def get_id(self, value):
+        if value is None:
+            return value
+
+        snapshot = self._snapshot
+        entry = snapshot.identity.get(id(value))
+        if entry is not None and entry[0] is value:
+            key = entry[1]
+        elif _probe(snapshot.id_to_key, value) is not _MISSING:
+            return value
+        else:
+            key = self.get_key(value)
+
+        db_id = _probe(snapshot.key_to_id, key)
+        if db_id is _MISSING:
+            raise ValidationError(
+                _("Value {value} does not have a registered id.").format(value=value)
+            )
+
+        return db_id
 
     def get_class(self, value):
-        try:
-            self.from_class(value)
-        except ValidationError:
-            return self.from_key(value)
+        snapshot = self._snapshot
+        if snapshot.find_key(value) is not _MISSING:
+            return value
 
-        return value
+        obj = _probe(snapshot.key_to_class, value)
+        if obj is not _MISSING:
+            return obj
+
+        if snapshot.lazy:
+            obj = self._get_lazy(value)
+            if obj is not _MISSING:
+                return obj
+
+        # Unknown value, let from_key warn and build the unknown item.
+        return self.from_key(value)
+
+    def iter_classes(self, values, unknown=_MISSING):
+        """
+        Convert many keys (or objects) to their objects at once. Whether the
+        batch holds keys or objects is decided once, from its first value.
+        Unknown values give the unknown_item_class, like get_class, unless an
+        `unknown` value is passed to be returned for them without warning.
+        None values are passed through.
+        """
+        values = iter(values)
+        for first in values:
+            break
+        else:
+            return
+
+        values = itertools.chain((first,), values)
+
+        if isinstance(first, str):
+            get = self._key_to_class.get
+            for value in values:
+                try:
+                    obj = get(value, _MISSING)
+                except TypeError:
+                    obj = _MISSING
+
+                yield self._get_batch_class(value, unknown) if obj is _MISSING else obj
+        else:
+            find_key = self._snapshot.find_key
+            for value in values:
+                if find_key(value) is _MISSING:
+                    yield self._get_batch_class(value, unknown)
+                else:
+                    yield value
+
+    def get_classes(self, values, unknown=_MISSING):
+        return list(self.iter_classes(values, unknown=unknown))
+
+    def _get_batch_class(self, value, unknown):
+        if value is None:
+            return value
+
+        if unknown is _MISSING:
+            return self.get_class(value)
+
+        if self.has_class(value):
+            return value
+
+        obj = _probe(self._key_to_class, value)
+        if obj is _MISSING and self._lazy:
+            obj = self._get_lazy(value)
+
+        return unknown if obj is _MISSING else obj
+
+    def iter_keys(self, values, unknown=_MISSING):
+        """
+        Convert many objects (or keys) to their keys at once. Unregistered
+        values raise a ValidationError, like get_key, unless an `unknown`
+        value is passed to be returned for them instead. None values are
+        passed through.
+        """
+        values = iter(values)
+        for first in values:
+            break
+        else:
+            return
+
+        values = itertools.chain((first,), values)
+
+        if isinstance(first, str):
+            key_to_class = self._key_to_class
+            for value in values:
+                try:
+                    found = value in key_to_class
+                except TypeError:
+                    found = False
+
+                yield value if found else self._get_batch_key(value, unknown)
+        else:
+            find_key = self._snapshot.find_key
+            for value in values:
+                key = find_key(value)
+                yield self._get_batch_key(value, unknown) if key is _MISSING else key
+
+    def get_keys(self, values, unknown=_MISSING):
+        return list(self.iter_keys(values, unknown=unknown))
+
+    def _get_batch_key(self, value, unknown):
+        if value is None or unknown is _MISSING:
+            return self.get_key(value)
+
+        if self.has_key(value):
+            return value
+
+        key = self._snapshot.find_key(value)
+        if key is _MISSING and self._lazy and self._resolve_imported():
+            key = self._snapshot.find_key(value)
+
+        return unknown if key is _MISSING else key
+
+    def enable_stats(self, callback=None, slow_threshold=None, sample_rate=1.0):
+        """
+        Start counting the lookups of the register and timing the conversions
+        of the model fields using it. `callback` is called with the details
+        of a `sample_rate` share of the unknown lookups, and of those slower
+        than `slow_threshold` seconds. The previous statistics are reset.
+        """
+        self.disable_stats()
+        self._stats = RegisterStats(
+            self,
+            callback=callback,
+            slow_threshold=slow_threshold,
+            sample_rate=sample_rate,
+        )
+        self._stats.install()
+        _registers.add(self)
+
+    def disable_stats(self):
+        """
+        Stop collecting statistics. The ones collected are kept in stats().
+        """
+        if self._stats is not None:
+            self._stats.uninstall()
+
+    def stats(self):
+        """
+        Return the statistics collected since enable_stats was last called,
+        or None if it never was.
+        """
+        return None if self._stats is None else self._stats.as_dict()
+
+    def _add_field(self, field):
+        self._fields[id(field)] = field
+
+        if self._stats is not None and self._stats.enabled:
+            self._stats.install_field(field)
+
+    def _cached(self, name, build):
+        """
+        Return the value built by `build`, computed once per snapshot of the
+        register (and settings generation, as the labels depend on them).
+        """
+        snapshot = self._snapshot
+        if snapshot.cache_generation != settings.generation:
+            snapshot.cache = {}
+            snapshot.cache_generation = settings.generation
+
+        cache = snapshot.cache
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = build()
+            return value
 
     @property
     def max_length(self):
-        if self._key_to_class:
-            return max(len(key) for key in self._key_to_class)
+        return self._cached("max_length", self._build_max_length)
+
+    def _build_max_length(self):
+        if self._key_to_class or self._lazy:
+            return max(
+                len(key) for key in itertools.chain(self._key_to_class, self._lazy)
+            )
+
+    def _iter_members(self):
+        """
+        Yield the keys and objects in registration order. The objects of the
+        lazy entries not imported yet are _MISSING.
+        """
+        if not self._lazy:
+            yield from self._key_to_class.items()
+            return
+
+        for key in self._order:
+            obj = self._key_to_class.get(key, _MISSING)
+            if obj is not _MISSING or key in self._lazy:
+                yield key, obj
 
     @property
     def choices(self):
-        return [(k, self._get_label(v, k)) for k, v in self._key_to_class.items()]
+        return self._cached(
+            "choices",
+            lambda: tuple((k, self._get_label(v, k)) for k, v in self._iter_members()),
+        )
 
     @property
     def flatchoices(self):
-        return [(v, self._get_label(v, k)) for k, v in self._key_to_class.items()]
+        return self._cached(
+            "flatchoices",
+            lambda: tuple(
+                (v, self._get_label(v, k)) for k, v in self._key_to_class.items()
+            ),
+        )
+
+    @property
+    def id_choices(self):
+        return self._cached(
+            "id_choices",
+            lambda: tuple(
+                (self._key_to_id[k], self._get_label(v, k))
+                for k, v in self._iter_members()
+                if k in self._key_to_id
+            ),
+        )
+
+    def get_label(self, value, default=None):
+        key = self._snapshot.find_key(value)
+        if key is _MISSING:
+            return default
+
+        return self._cached("key_labels", lambda: dict(self.choices)).get(key, default)
 
     def _get_label(self, klass, key):
-        return getattr(klass, settings.LABEL_NAME, key.replace("_", " ").title())
+        default = self._labels.get(key)
+        if default is None:
+            default = key.replace("_", " ").title()
+
+        return getattr(klass, settings.LABEL_NAME, default)
 
     def __iter__(self):
+        if self._lazy:
+            self.load_lazy()
+
         return iter(self._key_to_class.values())
 
 
@@ -116,16 +961,53 @@ class RegisterList(list):
 
 
 class RegisterChoicesMeta(type):
-    def __new__(mcs, name, bases, attrs):  # noqa: N804
-        cls = super().__new__(mcs, name, bases, attrs)
+    """
+    The register of a choices class, and its indexes, are built from the
+    members of the class the first time it is used, so unused classes cost
+    nothing more than their definition. The mapping, keys, labels and choices
+    are then built from the register and cached per register version, so
+    members registered later through `cls.register` are still reflected.
+    """
 
-        unknown_key = "_UNKNOWN_"
-        cls.register = Register(unknown_item_class=attrs.get(unknown_key))
+    _build_lock = threading.RLock()
 
-        for key, member in cls._all_mapping.items():
-            cls.register.register(member, db_key=key)
+    @property
+    def register(cls):
+        try:
+            return cls.__dict__["_register_"]
+        except KeyError:
+            pass
+
+        with RegisterChoicesMeta._build_lock:
+            if "_register_" not in cls.__dict__:
+                type.__setattr__(cls, "_register_", cls._build_register())
+
+        return cls.__dict__["_register_"]
+
+    @register.setter
+    def register(cls, value):
+        type.__setattr__(cls, "_register_", value)
+
+    def _build_register(cls):
+        attrs = cls.__dict__
+        register = Register(unknown_item_class=attrs.get("_UNKNOWN_"))
 
-        return cls
+        index_by = attrs.get("_INDEX_BY_", ())
+        if not isinstance(index_by, dict):
+            index_by = dict.fromkeys(index_by, True)
+
+        with register.batch():
+            for key, value in attrs.items():
+                if not key.startswith("_") and key.isupper():
+                    register.register(value, db_key=cls._key_name(key, value))
+
+            for attribute, unique in index_by.items():
+                register.index_by(attribute, unique=unique)
+
+        return register
+
+    def get_by(cls, attribute, value, default=None):
+        return cls.register.get_by(attribute, value, default=default)
 
     def _key_name(cls, name, obj):
         default_key = name.lower()
@@ -133,22 +1015,28 @@ class RegisterChoicesMeta(type):
 
     @property
     def _all_mapping(cls):
-        return {
-            cls._key_name(key, value): value
-            for key, value in cls.__dict__.items()
-            if not key.startswith("_") and key.isupper()
-        }
+        register = cls.register
+        return register._cached(
+            "all_mapping", lambda: MappingProxyType(dict(register._key_to_class))
+        )
 
     @property
-    def choices(cls):
-        choices = RegisterList()
-
-        for key, obj in cls._all_mapping.items():
-            default_verbose_name = key.replace("_", " ").title()
-            label = getattr(obj, settings.LABEL_NAME, default_verbose_name)
+    def keys(cls):
+        return cls.register._cached(
+            "keys", lambda: tuple(key for key, _label in cls.register.choices)
+        )
 
-            choices.append((key, label))
+    @property
+    def labels(cls):
+        return cls.register._cached(
+            "labels", lambda: tuple(label for _key, label in cls.register.choices)
+        )
 
+    @property
+    def choices(cls):
+        # The pairs are cached by the register, but callers may change the
+        # list, so each gets its own.
+        choices = RegisterList(cls.register.choices)
         choices.register = cls.register
         return choices
 
@@ -161,94 +1049,404 @@ class RegisterChoices(metaclass=RegisterChoicesMeta):
         return cls.register.get_class(klass)
 
 
-class RegisterField(models.CharField):
-    description = _("Store a string, return the associated class")
+def _pop_register(kwargs):
+    if "register" not in kwargs and "choices" not in kwargs:
+        raise ValueError(_("You must provide choices to the RegisterField."))
+
+    if "register" not in kwargs and not hasattr(kwargs["choices"], "register"):
+        raise ValueError(_("Choices must be a RegisterChoices instance."))
+
+    # When building the migrations, the register cannot be in the choices.
+    # It will be passed individually, so we take it from there.
+    return (
+        kwargs.pop("register") if "register" in kwargs else kwargs["choices"].register
+    )
 
-    def __init__(self, *args, **kwargs):
-        if "register" not in kwargs and "choices" not in kwargs:
-            raise ValueError(_("You must provide choices to the RegisterField."))
-
-        if "register" not in kwargs and not hasattr(kwargs["choices"], "register"):
-            raise ValueError(_("Choices must be a RegisterChoices instance."))
-
-        # When building the migrations, the register cannot be in the choices.
-        # It will be passed individually, so we take it from there.
-        self.register: Register = (
-            kwargs.pop("register")
-            if "register" in kwargs
-            else kwargs["choices"].register
-        )
+
+def _get_default(field):
+    """
+    Return the default of a register field as a Python object. The default
+    of every new model instance goes through here, so a constant default is
+    only resolved once per register version. Callable defaults are called
+    every time, but a registered object they return is used as is.
+    """
+    default = field.default
+    if field.has_default() and callable(default):
+        value = default()
+        if field.register.has_class(value):
+            return value
+
+        return field.to_python(value)
+
+    version = field.register.version
+    cached = field._resolved_default
+    if cached is not None and cached[0] == version and cached[1] is default:
+        return cached[2]
+
+    value = field.to_python(models.Field.get_default(field))
+    field._resolved_default = (version, default, value)
+    return value
+
+
+class RegisterFieldMixin:
+    """
+    Behaviour shared by the model fields storing a register member. The
+    subclasses define how a member is converted to its database value.
+
+    With lazy=True, the values loaded from the database are not converted:
+    the instances keep the raw value, converted when the attribute is read.
+    """
+
+    def __init__(self, *args, lazy=False, **kwargs):
+        self.register: Register = _pop_register(kwargs)
+        self._resolved_default = None
+        self.lazy = lazy
+        if lazy:
+            self.descriptor_class = RegisterDescriptor
 
         if "choices" not in kwargs:
-            kwargs["choices"] = self.register.choices
+            kwargs["choices"] = self._get_db_choices()
 
-        if "max_length" not in kwargs and (max_length := self.register.max_length):
-            kwargs["max_length"] = max_length
+        self._update_kwargs(kwargs)
+        super().__init__(*args, **kwargs)
 
-        if "default" in kwargs:
+        if self.has_default():
             try:
-                kwargs["default"] = self.register.get_key(kwargs["default"])
+                self.default = self.get_prep_value(self.default)
             except ValidationError:
                 pass
 
-        super().__init__(*args, **kwargs)
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+        self.register._add_field(self)
 
-    def from_db_value(self, value, expression, connection):
-        if not value:
-            return value
+    def _update_kwargs(self, kwargs):
+        pass
 
-        return self.register.get_class(value)
+    def _get_db_choices(self):
+        raise NotImplementedError
+
+    def _has_db_value(self, value):
+        raise NotImplementedError
 
     def get_default(self):
-        default = super().get_default()
+        return _get_default(self)
 
-        if default:
-            return self.register.get_class(default)
+    def get_db_converters(self, connection):
+        if self.lazy:
+            # The descriptor converts the value when it is read.
+            return []
 
-        return default
+        return super().get_db_converters(connection)
 
-    def to_python(self, value):
-        if not value:
+    def _get_raw_value(self, obj):
+        if self.lazy and self.attname in obj.__dict__:
+            return obj.__dict__[self.attname]
+
+        return getattr(obj, self.attname)
+
+    def _to_raw_value(self, value):
+        """
+        Return the database value of a registered object (or unknown item)
+        assigned to a lazy field. Raw values, and the objects which have none,
+        are returned as they are.
+        """
+        if value is None or type(value) in (str, int):
             return value
 
-        return self.register.get_class(value)
+        register = self.register
+        if isinstance(value, register.unknown_item_class):
+            return getattr(value, settings.KEY_NAME, value)
 
-    def get_prep_value(self, value):
-        if not value:
+        if not register.has_class(value):
             return value
 
-        return self.register.get_key(value)
+        try:
+            return self.get_prep_value(value)
+        except ValidationError:
+            return value
+
+    def pre_save(self, model_instance, add):
+        if self.lazy:
+            return self._get_raw_value(model_instance)
+
+        return super().pre_save(model_instance, add)
 
     def value_from_object(self, obj):
-        value = super().value_from_object(obj)
-        return self.get_prep_value(value)
+        return self.get_prep_value(self._get_raw_value(obj))
 
     def deconstruct(self):
         name, path, args, kwargs = super().deconstruct()
         kwargs.pop("choices", None)
         kwargs["register"] = self.register
+        if self.lazy:
+            kwargs["lazy"] = True
         return name, path, args, kwargs
 
     def clean(self, value, model_instance):
         """
         We need to override clean because it runs the validations on the
-        Python object instead of on the database string.
+        Python object instead of on the database value.
         """
         value = self.get_prep_value(value)
         self.validate(value, model_instance)
         self.run_validators(value)
         return self.to_python(value)
 
+    def validate(self, value, model_instance):
+        """
+        Same as the default validation, but the choice membership is checked
+        against the register directly instead of looping over the choices.
+        """
+        if not self.editable:
+            return
+
+        if value not in self.empty_values and not self._has_db_value(value):
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+
+        if value is None and not self.null:
+            raise ValidationError(self.error_messages["null"], code="null")
+
+        if not self.blank and value in self.empty_values:
+            raise ValidationError(self.error_messages["blank"], code="blank")
+
     def _get_flatchoices(self):
         return self.register.flatchoices
 
     flatchoices = property(_get_flatchoices)
 
     def _register_choices(self):
-        return self.register.choices
+        return self._get_db_choices()
 
     def _register_choices_set(self, value):
         return
 
     choices = property(_register_choices, _register_choices_set)
     _choices = property(_register_choices, _register_choices_set)
+
+
+class RegisterField(RegisterFieldMixin, models.CharField):
+    description = _("Store a string, return the associated class")
+
+    def _update_kwargs(self, kwargs):
+        if "max_length" not in kwargs and (max_length := self.register.max_length):
+            kwargs["max_length"] = max_length
+
+    def _get_db_choices(self):
+        return self.register.choices
+
+    def _has_db_value(self, value):
+        return self.register.has_key(value)
+
+    def from_db_value(self, value, expression, connection):
+        if not value:
+            return value
+
+        return self.register.get_class(value)
+
+    def to_python(self, value):
+        if not value:
+            return value
+
+        return self.register.get_class(value)
+
+    def get_prep_value(self, value):
+        if not value:
+            return value
+
+        return self.register.get_key(value)
+
+
+class IntegerRegisterField(RegisterFieldMixin, models.IntegerField):
+    """
+    Store the registered objects by the numeric id they were registered with,
+    instead of their key. Every member of the register needs a db_id.
+    """
+
+    description = _("Store an integer, return the associated class")
+
+    def _get_db_choices(self):
+        return self.register.id_choices
+
+    def _has_db_value(self, value):
+        return self.register.has_id(value)
+
+    def _parse_id(self, value):
+        # Forms and url parameters give the ids as strings.
+        if isinstance(value, str) and not self.register.has_key(value):
+            return super().to_python(value)
+
+        return value
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+
+        return self.register.from_id(value)
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+
+        value = self._parse_id(value)
+
+        if isinstance(value, int):
+            return self.register.from_id(value)
+
+        return self.register.get_class(value)
+
+    def get_prep_value(self, value):
+        if value in self.empty_values:
+            return None
+
+        return self.register.get_id(self._parse_id(value))
+
+
+class SmallIntegerRegisterField(IntegerRegisterField, models.SmallIntegerField):
+    description = _("Store a small integer, return the associated class")
+
+
+RegisterField.register_lookup(RegisterMemberTransform)
+RegisterField.register_lookup(RegisterLabelTransform)
+IntegerRegisterField.register_lookup(RegisterMemberTransform)
+IntegerRegisterField.register_lookup(RegisterLabelTransform)
+
+
+class RegisterSetField(models.BigIntegerField):
+    """
+    Store a set of registered objects as a bitmask, the db_id of each member
+    being its bit position. Only ids from 0 to 62 can be stored.
+    """
+
+    description = _("Store a bitmask, return a set of the associated classes")
+    max_bit = 62
+
+    def __init__(self, *args, **kwargs):
+        self.register: Register = _pop_register(kwargs)
+        self._resolved_default = None
+        kwargs.pop("choices", None)
+        super().__init__(*args, **kwargs)
+
+        if self.has_default() and not callable(self.default):
+            try:
+                self.default = self.get_prep_value(self.default)
+            except ValidationError:
+                pass
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+        self.register._add_field(self)
+
+    def _get_bit(self, value):
+        db_id = self.register.get_id(value)
+
+        if not isinstance(db_id, int) or not 0 <= db_id <= self.max_bit:
+            raise ValidationError(
+                _(
+                    "Value {value} cannot be stored in a set, its id must be "
+                    "between 0 and {max_bit}."
+                ).format(value=value, max_bit=self.max_bit)
+            )
+
+        return db_id
+
+    def _from_mask(self, mask):
+        members = []
+
+        while mask:
+            low_bit = mask & -mask
+            members.append(self.register.from_id(low_bit.bit_length() - 1))
+            mask ^= low_bit
+
+        return frozenset(members)
+
+    def _iter_values(self, value):
+        # A single member (or key) is accepted as a set of one.
+        if isinstance(value, str) or self.register.has_class(value):
+            return (value,)
+
+        return value
+
+    def get_default(self):
+        return _get_default(self)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+
+        return self._from_mask(value)
+
+    def to_python(self, value):
+        if value is None:
+            return value
+
+        if isinstance(value, str) and not self.register.has_key(value):
+            # Serialized values are the bitmask as a string.
+            value = super().to_python(value)
+
+        if isinstance(value, int):
+            return self._from_mask(value)
+
+        return frozenset(
+            self.register.get_class(item) for item in self._iter_values(value)
+        )
+
+    def get_prep_value(self, value):
+        if value is None or isinstance(value, int):
+            return value
+
+        mask = 0
+        for item in self._iter_values(value):
+            mask |= 1 << self._get_bit(item)
+
+        return mask
+
+    def value_from_object(self, obj):
+        value = super().value_from_object(obj)
+
+        if value is None:
+            return value
+
+        return [self.register.get_key(item) for item in self.to_python(value)]
+
+    def value_to_string(self, obj):
+        return str(self.get_prep_value(self.value_from_object(obj)))
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["register"] = self.register
+        return name, path, args, kwargs
+
+    def clean(self, value, model_instance):
+        """
+        Validate the bitmask, then return the set of objects.
+        """
+        value = self.get_prep_value(value)
+        self.validate(value, model_instance)
+        self.run_validators(value)
+        return self.to_python(value)
+
+    def formfield(self, **kwargs):
+        defaults = {
+            "form_class": forms.TypedMultipleChoiceField,
+            "choices": self.register.choices,
+            "coerce": self.register.get_class,
+        }
+
+        if self.has_default() and not callable(self.default):
+            defaults["initial"] = [
+                self.register.get_key(item) for item in self.get_default()
+            ]
+
+        # Skip the integer form field arguments, the members are picked from
+        # a list of choices.
+        return models.Field.formfield(self, **{**defaults, **kwargs})
+
+
+RegisterSetField.register_lookup(BitmaskContains)
+RegisterSetField.register_lookup(BitmaskContainsAll)
+RegisterSetField.register_lookup(BitmaskContainsAny)
@@ -0,0 +1,39 @@
+# Django
+from django.db.models.query_utils import DeferredAttribute
+
+
+class RegisterDescriptor(DeferredAttribute):
+    """
+    Attribute of the register fields created with lazy=True. The value loaded
+    from the database (or assigned) is kept as is on the instance, and only
+    converted to its registered object the first time it is read. The object
+    is then cached on the instance until another value is assigned. Assigned
+    objects are kept as their raw value too, next to the object.
+    """
+
+    def __init__(self, field):
+        super().__init__(field)
+        self.cache_name = f"_{field.attname}_object"
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+
+        value = super().__get__(instance, cls)
+        data = instance.__dict__
+        cached = data.get(self.cache_name)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+
+        obj = self.field.to_python(value)
+        data[self.cache_name] = (value, obj)
+        return obj
+
+    def __set__(self, instance, value):
+        # refresh_from_db() and the deferred loads assign the object read
+        # from a fresh instance, its raw value is kept in its place.
+        raw = self.field._to_raw_value(value)
+        data = instance.__dict__
+        data[self.field.attname] = raw
+        if raw is not value:
+            data[self.cache_name] = (raw, value)
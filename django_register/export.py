@@ -0,0 +1,200 @@
+"""
+Stream the rows of a queryset as CSV or newline-delimited JSON, for example
+through a StreamingHttpResponse. The register fields are read as raw keys and
+converted with a table built once per register, not member by member.
+"""
+
+# Standard libraries
+import csv
+import io
+import itertools
+
+# Django
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models.constants import LOOKUP_SEP
+from django.utils.translation import gettext_lazy as _
+
+# Local
+from .base import IntegerRegisterField, RegisterFieldMixin, RegisterSetField
+from .expressions import RawKeys, _get_member_value
+
+
+class Exporter:
+    """
+    Export the given fields of a queryset. A register field gives the key of
+    its member, followed by one column per attribute asked for it in
+    `attributes`, named "<field>__<attribute>". Rows are read with
+    iterator(chunk_size) and encoded chunk by chunk, so the memory used does
+    not depend on the number of rows.
+    """
+
+    def __init__(
+        self, queryset, fields, attributes=None, chunk_size=2000, encoding="utf-8"
+    ):
+        self.queryset = queryset
+        self.fields = tuple(fields)
+        self.attributes = {
+            name: tuple(names) for name, names in (attributes or {}).items()
+        }
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+
+        self._register_fields = {}
+        for name in self.fields:
+            field = self._get_field(name)
+
+            if isinstance(field, RegisterSetField):
+                raise ValueError(
+                    _(
+                        "{field} is a RegisterSetField, which cannot be exported."
+                    ).format(field=name)
+                )
+
+            if isinstance(field, RegisterFieldMixin):
+                self._register_fields[name] = field
+
+        for name in self.attributes:
+            if name not in self._register_fields:
+                raise ValueError(
+                    _("{field} is not an exported register field.").format(field=name)
+                )
+
+    def _get_field(self, path):
+        model = self.queryset.model
+        *relations, name = path.split(LOOKUP_SEP)
+
+        try:
+            for relation in relations:
+                model = model._meta.get_field(relation).related_model
+            return model._meta.get_field(name)
+        except (AttributeError, FieldDoesNotExist):
+            # Annotations and such are exported as they are.
+            return None
+
+    @property
+    def columns(self):
+        columns = []
+        for name in self.fields:
+            columns.append(name)
+            columns.extend(
+                f"{name}{LOOKUP_SEP}{attribute}"
+                for attribute in self.attributes.get(name, ())
+            )
+
+        return columns
+
+    def _get_table(self, field, attributes):
+        """
+        Map the database values of a register field to the values of its
+        columns. The table is cached on the register until it changes.
+        """
+        register = field.register
+        by_id = isinstance(field, IntegerRegisterField)
+
+        def build():
+            table = {}
+            for key, member in register._iter_members():
+                raw = register._key_to_id.get(key) if by_id else key
+                if raw is None:
+                    continue
+
+                table[raw] = (key,) + tuple(
+                    _get_member_value(register, key, member, attribute)
+                    for attribute in attributes
+                )
+
+            return table
+
+        if register._lazy:
+            register.load_lazy()
+        return register._cached(("export", by_id, attributes), build)
+
+    def iter_rows(self):
+        """
+        Yield the exported rows as tuples, in the order of the columns.
+        """
+        converters = []
+        for name in self.fields:
+            field = self._register_fields.get(name)
+            if field is None:
+                converters.append(None)
+                continue
+
+            attributes = self.attributes.get(name, ())
+            # Unknown values are given as they are, without attributes.
+            converters.append(
+                (self._get_table(field, attributes), (None,) * len(attributes))
+            )
+
+        selected = [
+            RawKeys(name) if name in self._register_fields else name
+            for name in self.fields
+        ]
+        rows = self.queryset.values_list(*selected).iterator(chunk_size=self.chunk_size)
+
+        for row in rows:
+            out = []
+            for value, converter in zip(row, converters):
+                if converter is None:
+                    out.append(value)
+                    continue
+
+                table, missing = converter
+                values = table.get(value)
+                if values is None:
+                    out.append(value)
+                    out.extend(missing)
+                else:
+                    out.extend(values)
+
+            yield out
+
+    def _iter_chunks(self):
+        rows = self.iter_rows()
+        while chunk := list(itertools.islice(rows, self.chunk_size)):
+            yield chunk
+
+    def iter_csv(self, header=True):
+        """
+        Yield the export as encoded CSV, one chunk of rows at a time.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        if header:
+            writer.writerow(self.columns)
+
+        for chunk in self._iter_chunks():
+            writer.writerows(chunk)
+            yield self._flush(buffer)
+
+        if buffer.tell():
+            yield self._flush(buffer)
+
+    def iter_ndjson(self):
+        """
+        Yield the export as encoded newline-delimited JSON, one object per
+        row, one chunk of rows at a time.
+        """
+        columns = self.columns
+        encoder = DjangoJSONEncoder()
+
+        for chunk in self._iter_chunks():
+            yield "".join(
+                encoder.encode(dict(zip(columns, row))) + "\n" for row in chunk
+            ).encode(self.encoding)
+
+    def _flush(self, buffer):
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data.encode(self.encoding)
+
+
+def export_csv(queryset, fields, **kwargs):
+    return Exporter(queryset, fields, **kwargs).iter_csv()
+
+
+def export_ndjson(queryset, fields, **kwargs):
+    return Exporter(queryset, fields, **kwargs).iter_ndjson()
@@ -0,0 +1,137 @@
+# Django
+from django.core.exceptions import FieldError, ValidationError
+from django.db import models
+from django.db.models import Case, Expression, ExpressionWrapper, F, Value, When
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.lookups import In
+from django.utils.translation import gettext_lazy as _
+
+# Local
+from .settings import settings
+
+
+def _get_member_value(register, key, member, attribute):
+    """
+    The value of an attribute of a registered object. The key and label are
+    the ones of the register, and nested attributes are separated by "__".
+    """
+    if attribute == settings.KEY_NAME:
+        return key
+
+    if attribute == settings.LABEL_NAME:
+        return register._get_label(member, key)
+
+    value = member
+    for name in attribute.split(LOOKUP_SEP):
+        value = getattr(value, name, None)
+
+    return value
+
+
+def _resolve_register_field(field_name, *args):
+    source = F(field_name).resolve_expression(*args)
+
+    if not hasattr(source.output_field, "register"):
+        raise FieldError(_("{field} is not a register field.").format(field=field_name))
+
+    return source
+
+
+class RegisterAttribute(Expression):
+    """
+    An attribute of the objects stored in a register field, as a database
+    expression. It is built as a CASE on the database values of the
+    registered objects, so it can be used in annotate(), order_by() and
+    aggregates.
+    """
+
+    def __init__(self, field_name, attribute, default=None, output_field=None):
+        super().__init__(output_field=output_field)
+        self.field_name = field_name
+        self.attribute = attribute
+        self.default = default
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.field_name!r}, {self.attribute!r})"
+
+    def resolve_expression(
+        self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False
+    ):
+        source = _resolve_register_field(
+            self.field_name, query, allow_joins, reuse, summarize, for_save
+        )
+        field = source.output_field
+        register = field.register
+
+        if register._lazy:
+            register.load_lazy()
+        groups = register._cached(
+            ("attribute", self.attribute, type(field)),
+            lambda: self._group_db_values(field),
+        )
+        case = Case(
+            *(When(In(source, values), then=Value(value)) for value, values in groups),
+            default=Value(self.default),
+            output_field=self._output_field_or_none,
+        )
+        return case.resolve_expression(query, allow_joins, reuse, summarize, for_save)
+
+    def _group_db_values(self, field):
+        """
+        Group the database values of the registered objects by attribute
+        value, to give one WHEN per distinct value.
+        """
+        register = field.register
+        groups = {}
+        unhashable = []
+
+        for key, member in register._key_to_class.items():
+            value = _get_member_value(register, key, member, self.attribute)
+
+            if value is None:
+                continue
+
+            try:
+                db_value = field.get_prep_value(member)
+            except ValidationError:
+                # The member cannot be stored in this field (no id for example).
+                continue
+
+            try:
+                groups.setdefault(value, []).append(db_value)
+            except TypeError:
+                unhashable.append((value, [db_value]))
+
+        return tuple(
+            (value, tuple(db_values))
+            for value, db_values in [*groups.items(), *unhashable]
+        )
+
+
+class RawKeys(Expression):
+    """
+    The value a register field stores in the database (its key, id or
+    bitmask), without converting it to the registered objects. Meant for
+    reading many rows with values() or values_list(), as for exports.
+    """
+
+    def __init__(self, field_name):
+        super().__init__()
+        self.field_name = field_name
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.field_name!r})"
+
+    def resolve_expression(
+        self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False
+    ):
+        source = _resolve_register_field(
+            self.field_name, query, allow_joins, reuse, summarize, for_save
+        )
+
+        # The plain field of the same database type has no converter.
+        output_field = getattr(models, source.output_field.get_internal_type())()
+        wrapper = ExpressionWrapper(source, output_field=output_field)
+        return wrapper.resolve_expression(
+            query, allow_joins, reuse, summarize, for_save
+        )
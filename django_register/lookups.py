@@ -0,0 +1,212 @@
+# Standard libraries
+import operator
+import re
+
+# Django
+from django.core.exceptions import EmptyResultSet, FieldError, ValidationError
+from django.db.models import Field, Lookup, Transform
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+
+
+class BitmaskLookup(Lookup):
+    """
+    Compare the bitmask stored by a RegisterSetField with the bitmask of the
+    given members.
+    """
+
+    template = None
+    repeat_rhs = False
+
+    def as_sql(self, compiler, connection):
+        return self._as_bitmask_sql(compiler, connection, "(%s & %s)")
+
+    def as_oracle(self, compiler, connection):
+        return self._as_bitmask_sql(compiler, connection, "BITAND(%s, %s)")
+
+    def _as_bitmask_sql(self, compiler, connection, bitand):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        params = (*lhs_params, *rhs_params)
+
+        if self.repeat_rhs:
+            params += tuple(rhs_params)
+
+        return self.template % {"bitand": bitand % (lhs, rhs), "rhs": rhs}, params
+
+
+class BitmaskContainsAll(BitmaskLookup):
+    lookup_name = "contains_all"
+    template = "%(bitand)s = %(rhs)s"
+    repeat_rhs = True
+
+
+class BitmaskContains(BitmaskContainsAll):
+    lookup_name = "contains"
+
+
+class BitmaskContainsAny(BitmaskLookup):
+    lookup_name = "contains_any"
+    template = "%(bitand)s <> 0"
+
+
+def _compare(compare):
+    def predicate(value, rhs):
+        if value is None:
+            return False
+
+        try:
+            return compare(value, rhs)
+        except TypeError:
+            return False
+
+    return predicate
+
+
+def _regex(value, rhs, flags=0):
+    return re.search(rhs, str(value), flags) is not None
+
+
+# Python equivalents of Django's lookups, evaluated on the registered objects.
+PREDICATES = {
+    "exact": lambda value, rhs: value == rhs,
+    "iexact": _compare(lambda value, rhs: str(value).lower() == str(rhs).lower()),
+    "gt": _compare(operator.gt),
+    "gte": _compare(operator.ge),
+    "lt": _compare(operator.lt),
+    "lte": _compare(operator.le),
+    "in": _compare(lambda value, rhs: value in rhs),
+    "range": _compare(lambda value, rhs: rhs[0] <= value <= rhs[1]),
+    "contains": _compare(lambda value, rhs: str(rhs) in str(value)),
+    "icontains": _compare(lambda value, rhs: str(rhs).lower() in str(value).lower()),
+    "startswith": _compare(lambda value, rhs: str(value).startswith(str(rhs))),
+    "istartswith": _compare(
+        lambda value, rhs: str(value).lower().startswith(str(rhs).lower())
+    ),
+    "endswith": _compare(lambda value, rhs: str(value).endswith(str(rhs))),
+    "iendswith": _compare(
+        lambda value, rhs: str(value).lower().endswith(str(rhs).lower())
+    ),
+    "regex": _compare(_regex),
+    "iregex": _compare(lambda value, rhs: _regex(value, rhs, re.IGNORECASE)),
+    "isnull": lambda value, rhs: (value is None) == bool(rhs),
+}
+
+
+class RegisterPredicateLookup(Lookup):
+    """
+    Evaluate the lookup on every registered object, in Python, then filter
+    the column on the database values of the matching objects.
+    """
+
+    prepare_rhs = False
+    can_use_none_as_rhs = True
+    predicate = None
+
+    def get_db_values(self, field):
+        if hasattr(self.rhs, "resolve_expression"):
+            raise ValueError(
+                _(
+                    "Register lookups can only be compared to a value, not {rhs}."
+                ).format(rhs=self.rhs)
+            )
+
+        rhs = list(self.rhs) if self.lookup_name == "in" else self.rhs
+        values = []
+
+        for member in field.register:
+            if not self.predicate(self.lhs.get_member_value(field, member), rhs):
+                continue
+
+            try:
+                values.append(field.get_prep_value(member))
+            except ValidationError:
+                # The member cannot be stored in this field (no id for example).
+                pass
+
+        return values
+
+    def as_sql(self, compiler, connection):
+        source = self.lhs.get_register_source()
+        values = self.get_db_values(source.output_field)
+
+        if not values:
+            raise EmptyResultSet
+
+        sql, params = compiler.compile(source)
+        placeholders = ", ".join(["%s"] * len(values))
+        return f"{sql} IN ({placeholders})", (*params, *values)
+
+
+_PREDICATE_LOOKUPS = {
+    name: type(
+        f"Register{name.title()}Lookup",
+        (RegisterPredicateLookup,),
+        {"lookup_name": name, "predicate": staticmethod(predicate)},
+    )
+    for name, predicate in PREDICATES.items()
+}
+
+
+class RegisterMemberField(Field):
+    """
+    Output field of the register transforms. Any name following it is read
+    as an attribute of the registered objects, unless it is a lookup.
+    """
+
+    def get_lookup(self, lookup_name):
+        return _PREDICATE_LOOKUPS.get(lookup_name)
+
+    def get_transform(self, lookup_name):
+        return type(
+            "RegisterAttributeTransform",
+            (RegisterAttributeTransform,),
+            {"lookup_name": lookup_name},
+        )
+
+
+class RegisterTransform(Transform):
+    """
+    Base of the transforms reading a value from the registered objects. They
+    cannot be compiled themselves, only the lookups ending them can.
+    """
+
+    @cached_property
+    def output_field(self):
+        return RegisterMemberField()
+
+    def get_register_source(self):
+        return self.lhs.get_register_source()
+
+    def get_member_value(self, field, member):
+        raise NotImplementedError
+
+    def as_sql(self, compiler, connection):
+        raise FieldError(
+            _("The {name} transform can only be used in a filter.").format(
+                name=self.lookup_name
+            )
+        )
+
+
+class RegisterMemberTransform(RegisterTransform):
+    lookup_name = "member"
+
+    def get_register_source(self):
+        return self.lhs
+
+    def get_member_value(self, field, member):
+        return member
+
+
+class RegisterLabelTransform(RegisterMemberTransform):
+    lookup_name = "label"
+
+    def get_member_value(self, field, member):
+        return field.register.get_label(member)
+
+
+class RegisterAttributeTransform(RegisterTransform):
+    def get_member_value(self, field, member):
+        value = self.lhs.get_member_value(field, member)
+        return getattr(value, self.lookup_name, None)
@@ -1,4 +1,5 @@
 # Standard libraries
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, Iterable
 
 # Django
@@ -6,11 +7,14 @@ from django.utils.translation import gettext_lazy as _
 
 # Rest Framework
 from rest_framework import serializers
+from rest_framework.fields import empty
 
 # django_register
 from django_register.base import Register
 from .settings import settings
 
+_UNKNOWN = object()
+
 if TYPE_CHECKING:
     # Rest Framework
     from rest_framework.serializers import BaseSerializer
@@ -19,7 +23,11 @@ if TYPE_CHECKING:
 class RegisterField(serializers.CharField):
     def __init__(self, *args, **kwargs) -> None:
         self.register: Register = kwargs.pop("register", None)
-        self.keys: Iterable[str] = kwargs.pop("keys", None)
+        keys: Iterable[str] | None = kwargs.pop("keys", None)
+        self.keys: tuple[str, ...] | None = None if keys is None else tuple(keys)
+        self._representation_cache = ("representation", self.keys)
+        self._resolved: dict[Any, Any] = {}
+        self._resolved_version: int | None = None
         super().__init__(*args, **kwargs)
 
     def _get_register_from_parent(self, parent: "BaseSerializer"):
@@ -50,22 +58,85 @@ class RegisterField(serializers.CharField):
         if self.register is None:
             self.register = self._get_register_from_parent(parent)
 
-    def to_internal_value(self, data: str) -> str:
-        return self.register.get_class(data)
+    def _get_resolved(self) -> dict[Any, Any]:
+        # The fields are copied for each serializer instance, so this memo
+        # lives as long as the request validating the data.
+        if self._resolved_version != self.register.version:
+            self._resolved = {}
+            self._resolved_version = self.register.version
+        return self._resolved
+
+    def prime(self, values: Iterable[Any]) -> list[Any]:
+        """
+        Resolve many incoming values in one batch, so validating them
+        afterwards is a lookup in the memo. Return the values that are not
+        registered, without warning for them.
+        """
+        resolved = self._get_resolved()
+        pending = {}
+
+        for value in values:
+            if value is None or value == "":
+                continue
+            try:
+                if value not in resolved:
+                    pending[value] = None
+            except TypeError:
+                continue
+
+        unknown = []
+        objects = self.register.iter_classes(pending, unknown=_UNKNOWN)
+        for value, obj in zip(pending, objects):
+            if obj is _UNKNOWN:
+                unknown.append(value)
+            else:
+                resolved[value] = obj
+
+        return unknown
+
+    def to_internal_value(self, data: str) -> Any:
+        resolved = self._get_resolved()
+        try:
+            return resolved[data]
+        except (KeyError, TypeError):
+            pass
 
-    def run_validation(self, data: Any = ...) -> Any:
-        data = super().run_validation(data)
         obj = self.register.get_class(data)
+        if not isinstance(obj, self.register.unknown_item_class):
+            try:
+                resolved[data] = obj
+            except TypeError:
+                pass
+
+        return obj
+
+    def run_validation(self, data: Any = empty) -> Any:
+        obj = super().run_validation(data)
         if isinstance(obj, self.register.unknown_item_class):
             raise serializers.ValidationError(
                 _("Value {value} not a registered key.").format(value=data)
             )
-        return data
+        return obj
 
     def to_representation(self, value: str) -> str | dict[str, Any]:  # type: ignore[override]
         if self.keys is None:
             return self.register.get_key(value)
 
+        # The representation of a registered member only changes with the
+        # register, so it is computed once per member and copied afterwards.
+        # They are cached by identity, wide members being slow to hash.
+        representations = self.register._cached(self._representation_cache, dict)
+        entry = representations.get(id(value))
+        if entry is not None and entry[0] is value:
+            return dict(entry[1])
+
+        out = self._build_representation(value)
+        if id(value) in self.register._identity:
+            representations[id(value)] = (value, out)
+
+        return dict(out)
+
+    def _build_representation(self, value: Any) -> dict[str, Any]:
         out: dict[str, Any] = {}
         errors: list[str] = []
 
@@ -90,3 +161,39 @@ class RegisterField(serializers.CharField):
             )
 
         return out
+
+
+class RegisterListSerializer(serializers.ListSerializer):
+    """
+    List serializer checking the values of the child RegisterFields, in one
+    batch per field, before validating the items. All the unknown keys are
+    reported at once, by field name. The check is an extra pass over the data:
+    the items are still validated one by one, so this is not faster than the
+    default ListSerializer.
+    """
+
+    def to_internal_value(self, data: Any) -> list[Any]:
+        if isinstance(data, list):
+            self._prime_register_fields(data)
+
+        return super().to_internal_value(data)
+
+    def _prime_register_fields(self, data: list[Any]) -> None:
+        items = [item for item in data if isinstance(item, Mapping)]
+        errors = {}
+
+        for field in self.child._writable_fields:
+            if not isinstance(field, RegisterField):
+                continue
+
+            values = (field.get_value(item) for item in items)
+            unknown = field.prime(value for value in values if value is not empty)
+
+            if unknown:
+                errors[field.field_name] = [
+                    _("Value {value} not a registered key.").format(value=value)
+                    for value in unknown
+                ]
+
+        if errors:
+            raise serializers.ValidationError(errors)
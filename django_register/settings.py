@@ -4,17 +4,34 @@ from django.core.signals import setting_changed
 DEFAULTS = {
     "KEY_NAME": "key",
     "LABEL_NAME": "label",
+    "ID_NAME": "db_id",
+    "UNKNOWN_CACHE_SIZE": 128,
+    "UNKNOWN_WARNING_INTERVAL": None,
+    "UNKNOWN_TRACKED_KEYS": 10_000,
 }
 
 
 class Settings:
+    """
+    Settings are resolved once, then kept as plain attributes. They are
+    cleared when a REGISTER_FIELD_ setting changes, and the generation is
+    bumped so the values derived from them can be rebuilt.
+    """
+
+    def __init__(self):
+        self.generation = 0
+
     def __getattr__(self, item):
+        # Only called when the setting is not resolved yet.
         try:
-            return getattr(django_settings, "REGISTER_FIELD_" + item)
+            value = getattr(django_settings, "REGISTER_FIELD_" + item)
         except AttributeError:
-            if item in DEFAULTS:
-                return DEFAULTS[item]
-            raise AttributeError("Invalid REGISTER_FIELD setting: '%s'" % item)
+            if item not in DEFAULTS:
+                raise AttributeError("Invalid REGISTER_FIELD setting: '%s'" % item)
+            value = DEFAULTS[item]
+
+        setattr(self, item, value)
+        return value
 
     def change_setting(self, setting, value, enter, **kwargs):
         if not setting.startswith("REGISTER_FIELD_"):
@@ -25,16 +42,10 @@ class Settings:
         if setting not in DEFAULTS:
             return
 
-        # if entering, set the value; if exiting, restore or delete
-        if enter:
-            setattr(self, setting, value)
-        else:
-            # Only try to delete if the attribute exists as an instance attribute
-            if hasattr(self, setting):
-                delattr(self, setting)
-            # If value is not None, it means we're restoring to a previous override
-            if value is not None:
-                setattr(self, setting, value)
+        # Django settings already hold the new value, it is resolved again on
+        # the next access.
+        self.__dict__.pop(setting, None)
+        self.generation += 1
 
 
 settings = Settings()
@@ -0,0 +1,206 @@
+# Standard libraries
+import random
+import time
+import weakref
+from collections import Counter
+
+# Django
+from django.core.exceptions import ValidationError
+
+_registers = weakref.WeakSet()
+
+LOOKUPS = ("get_class", "get_key", "from_key", "from_id")
+FIELD_METHODS = ("from_db_value", "get_prep_value")
+
+
+class RegisterStats:
+    """
+    Lookup statistics of a register, collected while they are enabled.
+
+    The lookups of the register, and the conversions of the model fields
+    using it, are replaced by timed wrappers on the instances themselves, so
+    nothing is measured (or slowed down) once the stats are disabled.
+    `callback` is called for a sample of the unknown lookups, and of those
+    slower than `slow_threshold` seconds.
+    """
+
+    def __init__(self, register, callback=None, slow_threshold=None, sample_rate=1.0):
+        self.register = register
+        self.enabled = False
+        self.callback = callback
+        self.slow_threshold = slow_threshold
+        self.sample_rate = sample_rate
+
+        self.key_hits = 0
+        self.object_hits = 0
+        self.unknown_misses = Counter()
+        self.calls = Counter()
+        self.times = Counter()
+
+    def as_dict(self):
+        return {
+            "key_hits": self.key_hits,
+            "object_hits": self.object_hits,
+            "unknown_misses": dict(self.unknown_misses),
+            **{
+                name: {"calls": self.calls[name], "time": self.times[name]}
+                for name in FIELD_METHODS
+            },
+        }
+
+    def install(self):
+        self.enabled = True
+        for name in LOOKUPS:
+            method = getattr(type(self.register), name).__get__(self.register)
+            setattr(self.register, name, getattr(self, "_" + name)(method))
+
+        for field in list(self.register._fields.values()):
+            self.install_field(field)
+
+    def uninstall(self):
+        self.enabled = False
+        for name in LOOKUPS:
+            self.register.__dict__.pop(name, None)
+
+        for field in list(self.register._fields.values()):
+            for name in FIELD_METHODS:
+                field.__dict__.pop(name, None)
+
+    def install_field(self, field):
+        for name in FIELD_METHODS:
+            method = getattr(type(field), name).__get__(field)
+            setattr(field, name, self._timed(name, method))
+
+    def _timed(self, name, method):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.calls[name] += 1
+                self.times[name] += time.perf_counter() - start
+
+        return timed
+
+    def _report(self, method, value, start, unknown=False):
+        if self.callback is None:
+            return
+
+        elapsed = time.perf_counter() - start
+        slow = self.slow_threshold is not None and elapsed >= self.slow_threshold
+
+        if (unknown or slow) and random.random() < self.sample_rate:  # noqa: S311
+            self.callback(
+                register=self.register,
+                method=method,
+                value=value,
+                elapsed=elapsed,
+                unknown=unknown,
+            )
+
+    def _miss(self, value):
+        try:
+            self.unknown_misses[value] += 1
+        except TypeError:
+            self.unknown_misses[repr(value)] += 1
+
+    # The wrappers only count what the lookup resolves itself: an unknown
+    # value given to get_class or from_id is counted by from_key.
+
+    def _get_class(self, method):
+        register = self.register
+
+        def get_class(value):
+            start = time.perf_counter()
+            obj = method(value)
+
+            if register.has_class(value):
+                self.object_hits += 1
+            elif register.has_key(value):
+                self.key_hits += 1
+
+            self._report("get_class", value, start)
+            return obj
+
+        return get_class
+
+    def _get_key(self, method):
+        register = self.register
+
+        def get_key(value):
+            start = time.perf_counter()
+            try:
+                key = method(value)
+            except ValidationError:
+                self._miss(value)
+                self._report("get_key", value, start, unknown=True)
+                raise
+
+            if value is not None:
+                if register.has_key(value):
+                    self.key_hits += 1
+                else:
+                    self.object_hits += 1
+
+            self._report("get_key", value, start)
+            return key
+
+        return get_key
+
+    def _from_key(self, method):
+        register = self.register
+
+        def from_key(value, ignore_warning=False):
+            start = time.perf_counter()
+            obj = method(value, ignore_warning=ignore_warning)
+            unknown = not register.has_key(value)
+
+            if unknown:
+                self._miss(value)
+            else:
+                self.key_hits += 1
+
+            self._report("from_key", value, start, unknown=unknown)
+            return obj
+
+        return from_key
+
+    def _from_id(self, method):
+        register = self.register
+
+        def from_id(value, ignore_warning=False):
+            start = time.perf_counter()
+            obj = method(value, ignore_warning=ignore_warning)
+
+            if register.has_id(value):
+                self.key_hits += 1
+
+            self._report("from_id", value, start)
+            return obj
+
+        return from_id
+
+
+def aggregate():
+    """
+    Sum the statistics of every register that had its stats enabled.
+    """
+    total = {
+        "key_hits": 0,
+        "object_hits": 0,
+        "unknown_misses": Counter(),
+        **{name: {"calls": 0, "time": 0.0} for name in FIELD_METHODS},
+    }
+
+    for register in list(_registers):
+        stats = register.stats()
+        total["key_hits"] += stats["key_hits"]
+        total["object_hits"] += stats["object_hits"]
+        total["unknown_misses"].update(stats["unknown_misses"])
+
+        for name in FIELD_METHODS:
+            total[name]["calls"] += stats[name]["calls"]
+            total[name]["time"] += stats[name]["time"]
+
+    total["unknown_misses"] = dict(total["unknown_misses"])
+    return total
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# Standard libraries
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+
+# Django
+import django
+
+
+def runbenchmarks():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    django.setup()
+
+    # Local
+    import benchmarks
+    from benchmarks.utils import Suite, compare
+
+    available = sorted(
+        name[len("bench_") :]
+        for _, name, _ in pkgutil.iter_modules(benchmarks.__path__)
+        if name.startswith("bench_")
+    )
+
+    parser = argparse.ArgumentParser(description="Run the benchmarks.")
+    parser.add_argument("names", nargs="*", help=", ".join(available))
+    parser.add_argument("--output", help="Save the results to this JSON file.")
+    parser.add_argument(
+        "--compare", help="Compare the results with this saved JSON file."
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", help="Register sizes to benchmark."
+    )
+    parser.add_argument("--rows", type=int, nargs="+", help="Row counts to use.")
+    args = parser.parse_args()
+
+    if unknown := set(args.names) - set(available):
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    suite = Suite(repeat=args.repeat, sizes=args.sizes, rows=args.rows)
+
+    for name in args.names or available:
+        module = importlib.import_module(f"benchmarks.bench_{name}")
+        module.run(suite)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(suite.results, output, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            print(f"\nCompared to {args.compare}:")
+            compare(suite.results, json.load(baseline))
+
+
+if __name__ == "__main__":
+    runbenchmarks()
@@ -0,0 +1,15 @@
+# Standard libraries
+from dataclasses import dataclass
+
+
+@dataclass(unsafe_hash=True)
+class Handler:
+    name: str
+
+
+FOO = Handler("foo")
+BAR = Handler("bar")
+
+
+class Namespace:
+    BAZ = Handler("baz")
@@ -0,0 +1,22 @@
+# Generated by Django 6.1.2 on 2026-10-17 20:40
+
+import django_register.base
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tests", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="city",
+            name="language",
+            field=django_register.base.IntegerRegisterField(
+                blank=True,
+                null=True,
+                register=django_register.base.Register(),
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.1.2 on 2026-10-17 20:42
+
+import django_register.base
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tests", "0002_city_language"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="city",
+            name="spoken_languages",
+            field=django_register.base.RegisterSetField(
+                default=0,
+                register=django_register.base.Register(),
+            ),
+        ),
+    ]
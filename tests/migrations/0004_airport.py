@@ -0,0 +1,45 @@
+# Generated by Django 6.1.2 on 2026-10-17 21:16
+
+import django_register.base
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tests", "0003_city_spoken_languages"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Airport",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50)),
+                (
+                    "country",
+                    django_register.base.RegisterField(
+                        lazy=True,
+                        max_length=13,
+                        register=django_register.base.Register(),
+                    ),
+                ),
+                (
+                    "language",
+                    django_register.base.IntegerRegisterField(
+                        blank=True,
+                        lazy=True,
+                        null=True,
+                        register=django_register.base.Register(),
+                    ),
+                ),
+            ],
+        ),
+    ]
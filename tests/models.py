@@ -5,7 +5,13 @@ from dataclasses import dataclass
 from django.db import models
 
 # django_register
-from django_register import Register, RegisterChoices, RegisterField
+from django_register import (
+    IntegerRegisterField,
+    Register,
+    RegisterChoices,
+    RegisterField,
+    RegisterSetField,
+)
 
 
 @dataclass(unsafe_hash=True)
@@ -48,6 +54,18 @@ class ContinentChoices(RegisterChoices):
     EUROPE = ContinentInfo(key="Europe")
 
 
+@dataclass(unsafe_hash=True)
+class LanguageInfo:
+    db_id: int
+    speakers: int
+
+
+class LanguageChoices(RegisterChoices):
+    ENGLISH = LanguageInfo(db_id=1, speakers=1_500_000_000)
+    FRENCH = LanguageInfo(db_id=2, speakers=310_000_000)
+    GERMAN = LanguageInfo(db_id=3, speakers=135_000_000)
+
+
 class City(models.Model):
     name = models.CharField(max_length=50)
     country = RegisterField(
@@ -58,6 +76,16 @@ class City(models.Model):
     car_companies = RegisterField(
         register=cars_register, null=True, blank=True, max_length=50
     )
+    language = IntegerRegisterField(choices=LanguageChoices, null=True, blank=True)
+    spoken_languages = RegisterSetField(choices=LanguageChoices, default=frozenset())
+
+
+class Airport(models.Model):
+    name = models.CharField(max_length=50)
+    country = RegisterField(choices=CountryChoices, lazy=True)
+    language = IntegerRegisterField(
+        choices=LanguageChoices, lazy=True, null=True, blank=True
+    )
 
 
 class Neighborhood(models.Model):
@@ -1,9 +1,15 @@
+# Standard libraries
+from dataclasses import dataclass
+from unittest import mock
+
 # Django
 from django.contrib import admin
-from django.test import TestCase
+from django.test import RequestFactory, TestCase
 
 # django_register
-from tests.models import City, ContinentChoices, ContinentInfo
+from django_register import Register
+from django_register.admin import RegisterAdminMixin
+from tests.models import City, ContinentChoices, ContinentInfo, CountryChoices
 
 
 @admin.register(City)
@@ -11,6 +17,11 @@ class CityAdmin(admin.ModelAdmin):
     pass
 
 
+class CityRegisterAdmin(RegisterAdminMixin, admin.ModelAdmin):
+    list_display = ("name", "country", "continent")
+    list_display_links = ("country",)
+
+
 class AdminTestCase(TestCase):
     @classmethod
     def setUpTestData(cls) -> None:
@@ -29,7 +40,7 @@ class AdminTestCase(TestCase):
         )
         self.assertEqual(
             choices,
-            [("pizza", "Pizza")],
+            (("pizza", "Pizza"),),
         )
 
     def test_admin_select(self):
@@ -41,10 +52,10 @@ class AdminTestCase(TestCase):
         field = self.admin.opts._forward_fields_map["continent"]
         self.assertEqual(
             field.flatchoices,
-            [
+            (
                 (ContinentChoices.AMERICA, "America"),
                 (ContinentChoices.EUROPE, "Europe"),
-            ],
+            ),
         )
 
     def test_choices_gets_updated(self):
@@ -53,16 +64,16 @@ class AdminTestCase(TestCase):
 
         self.assertEqual(
             getattr(field, attr),
-            [
+            (
                 ("America", "America"),
                 ("Europe", "Europe"),
-            ],
+            ),
         )
 
         register = ContinentChoices.register
 
         self.assertEqual(
-            register.choices, [("America", "America"), ("Europe", "Europe")]
+            register.choices, (("America", "America"), ("Europe", "Europe"))
         )
 
         register.register(ContinentInfo(key="Asia"))
@@ -71,13 +82,68 @@ class AdminTestCase(TestCase):
 
         self.assertEqual(
             register.choices,
-            [("America", "America"), ("Europe", "Europe"), ("Asia", "Asia")],
+            (("America", "America"), ("Europe", "Europe"), ("Asia", "Asia")),
         )
         self.assertEqual(
             getattr(field, attr),
-            [
+            (
                 ("America", "America"),
                 ("Europe", "Europe"),
                 ("Asia", "Asia"),
-            ],
+            ),
+        )
+
+
+class RegisterAdminMixinTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.city = City.objects.create(
+            name="Paris", country=CountryChoices.FRANCE, continent=None
         )
+
+    def setUp(self):
+        self.admin = CityRegisterAdmin(City, admin.site)
+        self.request = RequestFactory().get("/")
+
+    def test_list_display(self):
+        name, country, continent = self.admin.get_list_display(self.request)
+
+        self.assertEqual(name, "name")
+        self.assertEqual(country.__name__, "country")
+        self.assertEqual(country.admin_order_field, "country")
+        self.assertEqual(country(self.city), "France")
+        self.assertIsNone(continent(self.city))
+
+    def test_list_display_links(self):
+        list_display = self.admin.get_list_display(self.request)
+        list_display_links = self.admin.get_list_display_links(
+            self.request, list_display
+        )
+
+        self.assertEqual(list_display_links, [list_display[1]])
+
+    def test_get_label(self):
+        register = CountryChoices.register
+
+        self.assertEqual(register.get_label(CountryChoices.CANADA), "Canada")
+        self.assertIsNone(register.get_label("canada"))
+        self.assertEqual(register.get_label(None, "-"), "-")
+
+    def test_unhashable_members(self):
+        @dataclass
+        class Drink:
+            label: str
+
+        register = Register()
+        water = register.register(Drink("Water"), db_key="water")
+
+        self.assertEqual(register.get_label(water), "Water")
+        self.assertEqual(register.get_label(Drink("Water"), "-"), "-")
+
+        field = City._meta.get_field("available_food")
+        with mock.patch.object(field, "register", register):
+            self.admin.list_display = ("name", "available_food")
+            _, display = self.admin.get_list_display(self.request)
+
+            self.city.available_food = water
+            self.assertEqual(display(self.city), "Water")
@@ -1,6 +1,6 @@
 # Django
 from django.test import TestCase
-from django_register import RegisterChoices
+from django_register import Register, RegisterChoices
 
 # django_register
 from tests.models import CountryChoices, CountryInfo
@@ -29,12 +29,12 @@ class ChoicesTestCase(TestCase):
     def test_register_choices(self):
         self.assertEqual(
             CountryChoices.register.choices,
-            [
+            (
                 ("canada", "Canada"),
                 ("france", "France"),
                 ("germany", "Germany"),
                 ("united_states", "United States"),
-            ],
+            ),
         )
 
     def test_register_unknown_option(self):
@@ -50,3 +50,67 @@ class ChoicesTestCase(TestCase):
             CountryChoices.register.unknown_item_class,
             UnknownOption,
         )
+
+    def test_keys_and_labels(self):
+        self.assertEqual(
+            CountryChoices.keys, ("canada", "france", "germany", "united_states")
+        )
+        self.assertEqual(
+            CountryChoices.labels, ("Canada", "France", "Germany", "United States")
+        )
+
+    def test_choices_are_built_once(self):
+        self.assertIs(CountryChoices.register.choices, CountryChoices.register.choices)
+        self.assertIs(CountryChoices.choices.register, CountryChoices.register)
+        self.assertIs(CountryChoices._all_mapping, CountryChoices._all_mapping)
+
+    def test_choices_can_be_changed(self):
+        choices = CountryChoices.choices
+        choices.insert(0, ("", "---"))
+
+        self.assertIsNot(CountryChoices.choices, choices)
+        self.assertEqual(CountryChoices.choices[0], ("canada", "Canada"))
+
+    def test_choices_follow_later_registrations(self):
+        class LocalChoices(RegisterChoices):
+            CANADA = CountryInfo("canada", "Canada")
+
+        choices = LocalChoices.choices
+        LocalChoices.register.register(CountryInfo("spain", "Spain"), db_key="spain")
+
+        self.assertIsNot(LocalChoices.choices, choices)
+        self.assertEqual(
+            LocalChoices.choices, [("canada", "Canada"), ("spain", "Spain")]
+        )
+        self.assertEqual(LocalChoices.keys, ("canada", "spain"))
+        self.assertEqual(LocalChoices.labels, ("Canada", "Spain"))
+        self.assertEqual(list(LocalChoices._all_mapping), ["canada", "spain"])
+
+    def test_register_built_on_first_use(self):
+        class LocalChoices(RegisterChoices):
+            _INDEX_BY_ = ("capital",)
+            CANADA = CountryInfo(population=37_742_154, capital="Ottawa")
+
+        self.assertNotIn("_register_", LocalChoices.__dict__)
+
+        register = LocalChoices.register
+        self.assertIs(LocalChoices.__dict__["_register_"], register)
+        self.assertIs(LocalChoices.register, register)
+        self.assertEqual(LocalChoices.get_by("capital", "Ottawa"), LocalChoices.CANADA)
+
+    def test_register_errors_on_first_use(self):
+        class LocalChoices(RegisterChoices):
+            CANADA = CountryInfo(population=37_742_154, capital="Ottawa")
+            OTHER_CANADA = CANADA
+
+        with self.assertRaises(ValueError):
+            LocalChoices.choices
+
+    def test_set_register(self):
+        class LocalChoices(RegisterChoices):
+            CANADA = CountryInfo(population=37_742_154, capital="Ottawa")
+
+        register = Register()
+        LocalChoices.register = register
+        self.assertIs(LocalChoices.register, register)
+        self.assertEqual(LocalChoices.choices, [])
@@ -0,0 +1,149 @@
+# Standard libraries
+import json
+from unittest import mock
+
+# Django
+from django.db.models import Value
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+
+# django_register
+from django_register.export import Exporter, export_csv, export_ndjson
+from tests.models import City, CountryChoices, LanguageChoices, Neighborhood
+
+
+class ExporterTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.paris = City.objects.create(
+            name="Paris",
+            country=CountryChoices.FRANCE,
+            language=LanguageChoices.FRENCH,
+        )
+        cls.berlin = City.objects.create(name="Berlin", country=CountryChoices.GERMANY)
+        cls.queryset = City.objects.order_by("name")
+
+    def test_csv(self):
+        content = b"".join(
+            export_csv(
+                self.queryset,
+                ["name", "country", "language"],
+                attributes={"country": ["label", "capital"], "language": ["speakers"]},
+            )
+        )
+
+        self.assertEqual(
+            content.decode().splitlines(),
+            [
+                "name,country,country__label,country__capital,language,language__speakers",
+                "Berlin,germany,Germany,Berlin,,",
+                f"Paris,france,France,Paris,french,{LanguageChoices.FRENCH.speakers}",
+            ],
+        )
+
+    def test_ndjson(self):
+        content = b"".join(
+            export_ndjson(
+                self.queryset,
+                ["name", "country"],
+                attributes={"country": ["population"]},
+            )
+        )
+
+        self.assertEqual(
+            [json.loads(line) for line in content.decode().splitlines()],
+            [
+                {
+                    "name": "Berlin",
+                    "country": "germany",
+                    "country__population": CountryChoices.GERMANY.population,
+                },
+                {
+                    "name": "Paris",
+                    "country": "france",
+                    "country__population": CountryChoices.FRANCE.population,
+                },
+            ],
+        )
+
+    def test_chunks(self):
+        exporter = Exporter(self.queryset, ["name"], chunk_size=1)
+
+        self.assertEqual(
+            list(exporter.iter_csv()), [b"name\r\nBerlin\r\n", b"Paris\r\n"]
+        )
+        self.assertEqual(list(exporter.iter_ndjson())[1], b'{"name": "Paris"}\n')
+        self.assertEqual(list(exporter.iter_csv(header=False))[0], b"Berlin\r\n")
+
+    def test_empty(self):
+        exporter = Exporter(City.objects.none(), ["name", "country"])
+
+        self.assertEqual(list(exporter.iter_csv()), [b"name,country\r\n"])
+        self.assertEqual(list(exporter.iter_ndjson()), [])
+
+    def test_does_not_convert_members(self):
+        register = CountryChoices.register
+        exporter = Exporter(
+            self.queryset, ["country"], attributes={"country": ["label"]}
+        )
+
+        with mock.patch.object(register, "get_class") as get_class:
+            rows = list(exporter.iter_rows())
+
+        self.assertEqual(rows, [["germany", "Germany"], ["france", "France"]])
+        get_class.assert_not_called()
+
+    def test_table_cached(self):
+        register = CountryChoices.register
+        version = register.version
+        attributes = {"country": ["label"]}
+
+        list(Exporter(self.queryset, ["country"], attributes=attributes).iter_rows())
+        with mock.patch.object(register, "_iter_members") as iter_members:
+            list(
+                Exporter(self.queryset, ["country"], attributes=attributes).iter_rows()
+            )
+
+        self.assertEqual(register.version, version)
+        iter_members.assert_not_called()
+
+    def test_unknown_key(self):
+        City.objects.filter(pk=self.berlin.pk).update(country=Value("prussia"))
+        exporter = Exporter(
+            self.queryset, ["country"], attributes={"country": ["label"]}
+        )
+
+        self.assertEqual(
+            list(exporter.iter_rows()), [["prussia", None], ["france", "France"]]
+        )
+
+    def test_through_relation(self):
+        Neighborhood.objects.create(name="Montparnasse", city=self.paris)
+        exporter = Exporter(
+            Neighborhood.objects.all(),
+            ["name", "city__country"],
+            attributes={"city__country": ["capital"]},
+        )
+
+        self.assertEqual(
+            list(exporter.iter_rows()), [["Montparnasse", "france", "Paris"]]
+        )
+
+    def test_streaming_response(self):
+        response = StreamingHttpResponse(
+            export_csv(self.queryset, ["name"]), content_type="text/csv"
+        )
+
+        self.assertEqual(
+            b"".join(response.streaming_content), b"name\r\nBerlin\r\nParis\r\n"
+        )
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            Exporter(self.queryset, ["spoken_languages"])
+
+        with self.assertRaises(ValueError):
+            Exporter(self.queryset, ["name"], attributes={"name": ["upper"]})
+
+        with self.assertRaises(ValueError):
+            Exporter(self.queryset, ["name"], attributes={"country": ["label"]})
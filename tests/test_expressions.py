@@ -0,0 +1,226 @@
+# Standard libraries
+from unittest import mock
+
+# Django
+from django.core.exceptions import FieldError
+from django.db import models
+from django.test import TestCase
+
+# django_register
+from django_register import RawKeys, Register, RegisterAttribute
+from tests.models import (
+    Airport,
+    City,
+    CountryChoices,
+    LanguageChoices,
+    LanguageInfo,
+    Neighborhood,
+)
+
+
+class RegisterAttributeTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.ottawa = City.objects.create(
+            name="Ottawa",
+            country=CountryChoices.CANADA,
+            language=LanguageChoices.ENGLISH,
+        )
+        cls.paris = City.objects.create(
+            name="Paris",
+            country=CountryChoices.FRANCE,
+            language=LanguageChoices.FRENCH,
+        )
+        cls.lyon = City.objects.create(name="Lyon", country=CountryChoices.FRANCE)
+        cls.berlin = City.objects.create(
+            name="Berlin",
+            country=CountryChoices.GERMANY,
+            language=LanguageChoices.GERMAN,
+        )
+
+    def test_annotate(self):
+        city = City.objects.annotate(
+            population=RegisterAttribute("country", "population")
+        ).get(pk=self.paris.pk)
+
+        self.assertEqual(city.population, CountryChoices.FRANCE.population)
+
+    def test_register_unchanged(self):
+        register = CountryChoices.register
+        version = register.version
+        choices = register.choices
+
+        for _ in range(2):
+            list(
+                City.objects.annotate(
+                    population=RegisterAttribute("country", "population")
+                )
+            )
+
+        self.assertEqual(register.version, version)
+        self.assertIs(register.choices, choices)
+
+    def test_order_by(self):
+        self.assertEqual(
+            list(
+                City.objects.order_by(
+                    RegisterAttribute("country", "population").desc(), "name"
+                ).values_list("name", flat=True)
+            ),
+            ["Berlin", "Lyon", "Paris", "Ottawa"],
+        )
+
+    def test_aggregate(self):
+        self.assertEqual(
+            City.objects.aggregate(
+                total=models.Sum(RegisterAttribute("country", "population"))
+            ),
+            {
+                "total": CountryChoices.CANADA.population
+                + 2 * CountryChoices.FRANCE.population
+                + CountryChoices.GERMANY.population
+            },
+        )
+
+    def test_group_by(self):
+        self.assertEqual(
+            list(
+                City.objects.values(capital=RegisterAttribute("country", "capital"))
+                .annotate(cities=models.Count("id"))
+                .order_by("capital")
+            ),
+            [
+                {"capital": "Berlin", "cities": 1},
+                {"capital": "Ottawa", "cities": 1},
+                {"capital": "Paris", "cities": 2},
+            ],
+        )
+
+    def test_key_and_label(self):
+        self.assertEqual(
+            list(
+                City.objects.filter(pk=self.ottawa.pk).values(
+                    key=RegisterAttribute("country", "key"),
+                    label=RegisterAttribute("country", "label"),
+                )
+            ),
+            [{"key": "canada", "label": "Canada"}],
+        )
+
+    def test_default(self):
+        self.assertEqual(
+            list(
+                City.objects.order_by("name").values_list(
+                    RegisterAttribute("language", "speakers", default=0), flat=True
+                )
+            ),
+            [
+                LanguageChoices.GERMAN.speakers,
+                0,
+                LanguageChoices.ENGLISH.speakers,
+                LanguageChoices.FRENCH.speakers,
+            ],
+        )
+
+    def test_integer_field_member_without_id(self):
+        register = Register()
+        for member in LanguageChoices:
+            register.register(member, db_key=LanguageChoices.register.get_key(member))
+        register.register(LanguageInfo(db_id=None, speakers=75_000_000), db_key="ko")
+
+        with mock.patch.object(City._meta.get_field("language"), "register", register):
+            self.assertEqual(
+                dict(
+                    City.objects.values_list(
+                        "name", RegisterAttribute("language", "speakers")
+                    )
+                ),
+                {
+                    "Berlin": LanguageChoices.GERMAN.speakers,
+                    "Lyon": None,
+                    "Ottawa": LanguageChoices.ENGLISH.speakers,
+                    "Paris": LanguageChoices.FRENCH.speakers,
+                },
+            )
+
+    def test_through_relation(self):
+        Neighborhood.objects.create(name="Montparnasse", city=self.paris)
+
+        neighborhood = Neighborhood.objects.annotate(
+            capital=RegisterAttribute("city__country", "capital")
+        ).get()
+        self.assertEqual(neighborhood.capital, "Paris")
+
+    def test_not_a_register_field(self):
+        with self.assertRaises(FieldError):
+            City.objects.annotate(value=RegisterAttribute("name", "population"))
+
+
+class RawKeysTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.paris = City.objects.create(
+            name="Paris",
+            country=CountryChoices.FRANCE,
+            language=LanguageChoices.FRENCH,
+            spoken_languages={LanguageChoices.FRENCH, LanguageChoices.ENGLISH},
+        )
+        cls.berlin = City.objects.create(name="Berlin", country=CountryChoices.GERMANY)
+
+    def test_values_list(self):
+        self.assertEqual(
+            list(
+                City.objects.order_by("name").values_list(
+                    RawKeys("country"),
+                    RawKeys("language"),
+                    RawKeys("spoken_languages"),
+                )
+            ),
+            [("germany", None, 0), ("france", 2, 0b110)],
+        )
+
+    def test_values(self):
+        self.assertEqual(
+            list(
+                City.objects.filter(pk=self.paris.pk).values(
+                    "name", country_key=RawKeys("country")
+                )
+            ),
+            [{"name": "Paris", "country_key": "france"}],
+        )
+
+    def test_iterator_does_not_convert(self):
+        field = City._meta.get_field("country")
+        with mock.patch.object(field.register, "get_class") as get_class:
+            keys = list(
+                City.objects.order_by("name")
+                .values_list(RawKeys("country"), flat=True)
+                .iterator(chunk_size=1)
+            )
+
+        self.assertEqual(keys, ["germany", "france"])
+        get_class.assert_not_called()
+
+    def test_filter_and_relation(self):
+        Neighborhood.objects.create(name="Montparnasse", city=self.paris)
+
+        self.assertEqual(
+            list(
+                Neighborhood.objects.annotate(country=RawKeys("city__country"))
+                .filter(country="france")
+                .values_list("country", flat=True)
+            ),
+            ["france"],
+        )
+
+    def test_lazy_field(self):
+        Airport.objects.create(name="Orly", country=CountryChoices.FRANCE)
+
+        self.assertEqual(
+            list(Airport.objects.values_list(RawKeys("country"), flat=True)),
+            ["france"],
+        )
+
+    def test_not_a_register_field(self):
+        with self.assertRaises(FieldError):
+            City.objects.values_list(RawKeys("name"))
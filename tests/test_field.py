@@ -4,7 +4,7 @@ from django.db import models
 from django.test import TestCase
 
 # django_register
-from django_register.base import RegisterField, UnknownRegisterItem
+from django_register.base import Register, RegisterField, UnknownRegisterItem
 from tests.models import (
     CountryInfo,
     Neighborhood,
@@ -63,6 +63,45 @@ class RegisterFieldTestCase(TestCase):
         with self.assertRaises(ValidationError), self.assertWarns(UserWarning):
             City.objects.create(name="Ottawa")
 
+    def test_default_resolved_once(self):
+        register = Register()
+        toyota = CarCompanies("Toyota")
+        register.register(toyota, db_key="toyota")
+        field = RegisterField(register=register, default=toyota)
+
+        self.assertIs(field.get_default(), toyota)
+        version, default, value = field._resolved_default
+        self.assertEqual(
+            (version, default, value), (register.version, "toyota", toyota)
+        )
+
+        # The cached value is used until the register changes.
+        field._resolved_default = (version, default, "cached")
+        self.assertEqual(field.get_default(), "cached")
+
+        register.register(CarCompanies("Honda"), db_key="honda")
+        self.assertIs(field.get_default(), toyota)
+
+        field.default = "honda"
+        self.assertEqual(field.get_default(), CarCompanies("Honda"))
+
+    def test_callable_default(self):
+        register = Register()
+        toyota = CarCompanies("Toyota")
+        register.register(toyota, db_key="toyota")
+
+        field = RegisterField(register=register, default=lambda: toyota)
+        self.assertIs(field.get_default(), toyota)
+
+        field = RegisterField(register=register, default=lambda: "toyota")
+        self.assertIs(field.get_default(), toyota)
+        self.assertIsNone(field._resolved_default)
+
+    def test_no_default(self):
+        field = City._meta.get_field("available_food")
+        self.assertIsNone(field.get_default())
+        self.assertIsNone(City().available_food)
+
     def test_fails_if_fetching_before_registering(self):
         with self.assertRaises(ValueError):
             cars_register.register(CarCompanies("Toyota"), db_key="toyota")
@@ -75,8 +114,7 @@ class RegisterFieldTestCase(TestCase):
 
         cars_register.register(hyundai_car, db_key="hyundai")
 
-        cars_register._class_to_key.pop(hyundai_car)
-        cars_register._key_to_class.pop("hyundai")
+        cars_register.unregister("hyundai")
 
     def test_changing_register_dynamically(self):
         with self.assertRaises(ValueError):
@@ -89,8 +127,36 @@ class RegisterFieldTestCase(TestCase):
         self.paris.save()
         self.assertEqual(self.paris.car_companies, hyundai_car)
 
-        cars_register._class_to_key.pop(hyundai_car)
-        cars_register._key_to_class.pop("hyundai")
+        cars_register.unregister("hyundai")
+
+    def test_validate(self):
+        field = City._meta.get_field("country")
+
+        field.validate("france", self.paris)
+
+        with self.assertRaises(ValidationError) as context:
+            field.validate("francis", self.paris)
+        self.assertEqual(context.exception.code, "invalid_choice")
+        self.assertEqual(context.exception.params, {"value": "francis"})
+
+        with self.assertRaises(ValidationError) as context:
+            field.validate(None, self.paris)
+        self.assertEqual(context.exception.code, "null")
+
+        with self.assertRaises(ValidationError) as context:
+            field.validate("", self.paris)
+        self.assertEqual(context.exception.code, "blank")
+
+        City._meta.get_field("continent").validate(None, self.paris)
+
+    def test_full_clean(self):
+        city = City(name="Lyon", country=CountryChoices.FRANCE)
+        city.full_clean()
+        self.assertEqual(city.country, CountryChoices.FRANCE)
+
+        city = City(name="Lyon", country="france")
+        city.full_clean()
+        self.assertEqual(city.country, CountryChoices.FRANCE)
 
     def test_annotations(self):
         Neighborhood.objects.create(name="Montparnasse", city=self.paris)
@@ -110,8 +176,7 @@ class RegisterFieldTestCase(TestCase):
 
     def test_unknown_key(self):
         france = CountryChoices.FRANCE
-        CountryChoices.register._key_to_class.pop("france")
-        CountryChoices.register._class_to_key.pop(france)
+        CountryChoices.register.unregister("france")
 
         with self.assertWarns(UserWarning):
             self.paris.refresh_from_db()
@@ -0,0 +1,92 @@
+# Django
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+
+# django_register
+from django_register import IntegerRegisterField, SmallIntegerRegisterField
+from django_register.base import UnknownRegisterItem
+from tests.models import City, CountryChoices, LanguageChoices
+
+
+class IntegerRegisterFieldTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.paris = City.objects.create(
+            name="Paris",
+            country=CountryChoices.FRANCE,
+            language=LanguageChoices.FRENCH,
+        )
+        cls.berlin = City.objects.create(
+            name="Berlin",
+            country=CountryChoices.GERMANY,
+            language=LanguageChoices.GERMAN,
+        )
+
+    def test_stores_the_id(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT language FROM tests_city WHERE id = %s", [self.paris.pk]
+            )
+            self.assertEqual(cursor.fetchone(), (2,))
+
+        self.paris.refresh_from_db()
+        self.assertEqual(self.paris.language, LanguageChoices.FRENCH)
+
+    def test_filter(self):
+        self.assertEqual(City.objects.get(language=LanguageChoices.GERMAN), self.berlin)
+        self.assertEqual(City.objects.get(language="french"), self.paris)
+        self.assertEqual(City.objects.get(language=2), self.paris)
+        self.assertEqual(City.objects.get(language="2"), self.paris)
+
+    def test_choices(self):
+        field = City._meta.get_field("language")
+
+        self.assertEqual(field.choices, ((1, "English"), (2, "French"), (3, "German")))
+
+    def test_clean(self):
+        field = City._meta.get_field("language")
+
+        self.assertEqual(field.clean("3", self.paris), LanguageChoices.GERMAN)
+        self.assertEqual(
+            field.clean(LanguageChoices.ENGLISH, self.paris), LanguageChoices.ENGLISH
+        )
+
+        with self.assertRaises(ValidationError):
+            field.clean(12, self.paris)
+
+        with self.assertRaises(ValidationError) as context:
+            field.validate(12, self.paris)
+        self.assertEqual(context.exception.code, "invalid_choice")
+
+        with self.assertRaises(ValidationError):
+            field.clean(CountryChoices.FRANCE, self.paris)
+
+    def test_unknown_id(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE tests_city SET language = 12 WHERE id = %s", [self.paris.pk]
+            )
+
+        with self.assertWarns(UserWarning):
+            self.paris.refresh_from_db()
+        self.assertIsInstance(self.paris.language, UnknownRegisterItem)
+        self.assertEqual(self.paris.language.key, 12)
+
+    def test_member_without_id(self):
+        field = IntegerRegisterField(choices=CountryChoices)
+
+        with self.assertRaises(ValidationError):
+            field.get_prep_value(CountryChoices.FRANCE)
+
+    def test_deconstruct(self):
+        field = SmallIntegerRegisterField(
+            choices=LanguageChoices, default=LanguageChoices.ENGLISH
+        )
+        name, path, args, kwargs = field.deconstruct()
+
+        self.assertEqual(path, "django_register.base.SmallIntegerRegisterField")
+        self.assertEqual(kwargs["default"], 1)
+        self.assertIs(kwargs["register"], LanguageChoices.register)
+        self.assertNotIn("choices", kwargs)
+        self.assertEqual(field.get_internal_type(), "SmallIntegerField")
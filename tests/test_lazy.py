@@ -0,0 +1,138 @@
+# Standard libraries
+import importlib
+import sys
+
+# Django
+from django.forms import ValidationError
+from django.test import TestCase
+
+# django_register
+from django_register.base import Register
+from tests.models import CountryChoices
+
+MODULE = "tests.lazy_members"
+
+
+class LazyRegisterTestCase(TestCase):
+    def setUp(self):
+        sys.modules.pop(MODULE, None)
+        self.addCleanup(sys.modules.pop, MODULE, None)
+
+        self.register = Register()
+        self.register.register(CountryChoices.CANADA, db_key="canada")
+        self.register.register_lazy(f"{MODULE}:FOO", db_key="foo", label="Foo!")
+        self.register.register_lazy(f"{MODULE}:Namespace.BAZ", db_key="baz", db_id=3)
+        self.register.register(CountryChoices.FRANCE, db_key="france")
+
+    def test_not_imported_on_registration(self):
+        self.assertEqual(
+            self.register.choices,
+            (
+                ("canada", "Canada"),
+                ("foo", "Foo!"),
+                ("baz", "Baz"),
+                ("france", "France"),
+            ),
+        )
+        self.assertEqual(self.register.id_choices, ((3, "Baz"),))
+        self.assertEqual(self.register.max_length, 6)
+        self.assertTrue(self.register.has_key("foo"))
+        self.assertTrue(self.register.has_id(3))
+        self.assertEqual(self.register.get_key("foo"), "foo")
+        self.assertEqual(self.register.get_id("baz"), 3)
+
+        self.assertNotIn(MODULE, sys.modules)
+
+    def test_imported_on_first_lookup(self):
+        foo = self.register.from_key("foo")
+
+        self.assertIn(MODULE, sys.modules)
+        self.assertIs(foo, sys.modules[MODULE].FOO)
+        self.assertIs(self.register.get_class("foo"), foo)
+        self.assertEqual(self.register.get_key(foo), "foo")
+        self.assertTrue(self.register.has_key("baz"))
+
+        # The order and the given label are kept.
+        self.assertEqual(
+            self.register.choices,
+            (
+                ("canada", "Canada"),
+                ("foo", "Foo!"),
+                ("baz", "Baz"),
+                ("france", "France"),
+            ),
+        )
+
+    def test_imported_on_id_lookup(self):
+        baz = self.register.from_id(3)
+
+        self.assertEqual(baz.name, "baz")
+        self.assertEqual(self.register.get_id(baz), 3)
+
+    def test_objects_of_imported_modules(self):
+        module = importlib.import_module(MODULE)
+
+        self.assertIs(self.register.get_class(module.FOO), module.FOO)
+        self.assertEqual(self.register.get_key(module.Namespace.BAZ), "baz")
+        self.assertEqual(
+            self.register.get_keys([module.Namespace.BAZ, module.BAR], unknown=None),
+            ["baz", None],
+        )
+
+    def test_iter_imports_all(self):
+        module = importlib.import_module(MODULE)
+        sys.modules.pop(MODULE)
+
+        self.assertEqual(len(list(self.register)), 4)
+        self.assertEqual(self.register.get_classes(["foo", "baz"])[1].name, "baz")
+        self.assertEqual(self.register._lazy, {})
+        self.assertIsNot(self.register.from_key("foo"), module.FOO)
+
+    def test_get_by_imports_all(self):
+        self.register.index_by("name", unique=False)
+
+        self.assertEqual(self.register.get_by("name", "canada"), ())
+        self.assertEqual(
+            self.register.get_by("name", "foo"), (sys.modules[MODULE].FOO,)
+        )
+        self.assertEqual(self.register._lazy, {})
+
+    def test_duplicates(self):
+        with self.assertRaises(ValueError):
+            self.register.register_lazy(f"{MODULE}:BAR", db_key="foo")
+
+        with self.assertRaises(ValueError):
+            self.register.register_lazy(f"{MODULE}:BAR", db_key="bar", db_id=3)
+
+        with self.assertRaises(ValueError):
+            self.register.register(CountryChoices.GERMANY, db_key="baz")
+
+    def test_import_error(self):
+        self.register.register_lazy(f"{MODULE}:MISSING", db_key="missing", db_id=4)
+
+        with self.assertRaises(ImportError):
+            self.register.from_key("missing")
+
+        # The entry is left as it was.
+        self.assertTrue(self.register.has_key("missing"))
+        self.assertTrue(self.register.has_id(4))
+
+    def test_conflicting_entry(self):
+        module = importlib.import_module(MODULE)
+        self.register.register(module.BAR, db_key="bar")
+        self.register.register_lazy(f"{MODULE}:BAR", db_key="other_bar")
+
+        # Unrelated lookups are not affected.
+        with self.assertWarns(UserWarning):
+            self.register.get_class("totally_unknown")
+        self.assertEqual(self.register.get_key(module.FOO), "foo")
+        self.assertTrue(self.register.has_key("other_bar"))
+
+        with self.assertRaises(ValueError):
+            self.register.get_class("other_bar")
+
+    def test_unknown_object(self):
+        with self.assertRaises(ValidationError):
+            self.register.get_key(CountryChoices.GERMANY)
+
+        self.assertNotIn(MODULE, sys.modules)
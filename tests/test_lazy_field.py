@@ -0,0 +1,121 @@
+# Standard libraries
+import warnings
+from unittest import mock
+
+# Django
+from django.db.models import Value
+from django.forms.models import model_to_dict
+from django.test import TestCase
+
+# django_register
+from django_register.descriptors import RegisterDescriptor
+from tests.models import Airport, City, CountryChoices, LanguageChoices
+
+
+class LazyRegisterFieldTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.cdg = Airport.objects.create(
+            name="Charles de Gaulle",
+            country=CountryChoices.FRANCE,
+            language=LanguageChoices.FRENCH,
+        )
+        cls.ber = Airport.objects.create(name="Berlin", country="germany")
+
+    def test_descriptor(self):
+        self.assertIsInstance(Airport.country, RegisterDescriptor)
+        self.assertIsInstance(Airport.language, RegisterDescriptor)
+
+    def test_values_converted_on_access(self):
+        register = CountryChoices.register
+        with mock.patch.object(register, "get_class", wraps=register.get_class) as get:
+            airports = list(Airport.objects.order_by("name"))
+            self.assertEqual(get.call_count, 0)
+            self.assertEqual(airports[0].__dict__["country"], "germany")
+            self.assertEqual(airports[1].__dict__["language"], 2)
+
+            self.assertEqual(airports[0].country, CountryChoices.GERMANY)
+            self.assertEqual(airports[0].country, CountryChoices.GERMANY)
+            self.assertEqual(get.call_count, 1)
+
+        self.assertEqual(airports[1].language, LanguageChoices.FRENCH)
+        self.assertIsNone(airports[0].language)
+
+    def test_assignment(self):
+        airport = Airport.objects.get(pk=self.cdg.pk)
+        self.assertEqual(airport.country, CountryChoices.FRANCE)
+
+        airport.country = "germany"
+        self.assertEqual(airport.country, CountryChoices.GERMANY)
+
+        airport.country = CountryChoices.CANADA
+        self.assertEqual(airport.country, CountryChoices.CANADA)
+        airport.save()
+
+        airport.refresh_from_db()
+        self.assertEqual(airport.country, CountryChoices.CANADA)
+
+    def test_save_raw_value(self):
+        airport = Airport.objects.get(pk=self.ber.pk)
+        airport.name = "Berlin Brandenburg"
+        airport.save()
+
+        self.assertEqual(airport.__dict__["country"], "germany")
+        self.assertEqual(
+            Airport.objects.get(pk=self.ber.pk).country, CountryChoices.GERMANY
+        )
+
+    def test_values_are_raw(self):
+        self.assertEqual(
+            list(Airport.objects.order_by("name").values_list("country", "language")),
+            [("germany", None), ("france", 2)],
+        )
+        self.assertEqual(
+            list(Airport.objects.filter(country=CountryChoices.FRANCE)), [self.cdg]
+        )
+
+    def test_assignment_keeps_raw_value(self):
+        airport = Airport.objects.get(pk=self.ber.pk)
+        airport.country = CountryChoices.CANADA
+        airport.language = LanguageChoices.FRENCH
+
+        self.assertEqual(airport.__dict__["country"], "canada")
+        self.assertEqual(airport.__dict__["language"], 2)
+        self.assertIs(airport.country, CountryChoices.CANADA)
+
+    def test_refresh_keeps_raw_value(self):
+        airport = Airport.objects.get(pk=self.cdg.pk)
+        self.assertEqual(airport.country, CountryChoices.FRANCE)
+
+        airport.refresh_from_db()
+        self.assertEqual(airport.__dict__["country"], "france")
+        self.assertEqual(airport.__dict__["language"], 2)
+        self.assertEqual(airport.country, CountryChoices.FRANCE)
+
+        Airport.objects.filter(pk=self.cdg.pk).update(country=Value("prussia"))
+        with warnings.catch_warnings():
+            # The key is read from the fresh instance, and warned about.
+            warnings.simplefilter("ignore")
+            airport.refresh_from_db()
+        self.assertEqual(airport.__dict__["country"], "prussia")
+
+    def test_deferred(self):
+        airport = Airport.objects.only("name").get(pk=self.cdg.pk)
+        self.assertEqual(airport.country, CountryChoices.FRANCE)
+        self.assertEqual(airport.__dict__["country"], "france")
+
+    def test_model_to_dict(self):
+        airport = Airport.objects.get(pk=self.cdg.pk)
+        data = model_to_dict(airport)
+
+        self.assertEqual((data["country"], data["language"]), ("france", 2))
+        self.assertNotIn("_country_object", airport.__dict__)
+
+    def test_deconstruct(self):
+        field = Airport._meta.get_field("country")
+        _, _, _, kwargs = field.deconstruct()
+        self.assertIs(kwargs["lazy"], True)
+        self.assertTrue(field.clone().lazy)
+
+        _, _, _, kwargs = City._meta.get_field("country").deconstruct()
+        self.assertNotIn("lazy", kwargs)
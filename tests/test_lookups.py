@@ -0,0 +1,132 @@
+# Standard libraries
+from dataclasses import dataclass
+from unittest import mock
+
+# Django
+from django.core.exceptions import FieldError
+from django.db import models
+from django.test import TestCase
+
+# django_register
+from django_register import Register
+from tests.models import City, CountryChoices, LanguageChoices, Neighborhood
+
+
+class RegisterLookupsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.ottawa = City.objects.create(
+            name="Ottawa",
+            country=CountryChoices.CANADA,
+            language=LanguageChoices.ENGLISH,
+        )
+        cls.paris = City.objects.create(
+            name="Paris",
+            country=CountryChoices.FRANCE,
+            language=LanguageChoices.FRENCH,
+        )
+        cls.berlin = City.objects.create(
+            name="Berlin",
+            country=CountryChoices.GERMANY,
+            language=LanguageChoices.GERMAN,
+        )
+
+    def assertCities(self, queryset, cities):
+        self.assertEqual(list(queryset.order_by("name")), cities)
+
+    def test_member_attribute(self):
+        self.assertCities(
+            City.objects.filter(country__member__population__gt=50_000_000),
+            [self.berlin, self.paris],
+        )
+        self.assertCities(
+            City.objects.filter(country__member__capital="Ottawa"), [self.ottawa]
+        )
+        self.assertCities(
+            City.objects.filter(country__member__capital__in=["Paris", "Berlin"]),
+            [self.berlin, self.paris],
+        )
+        self.assertCities(
+            City.objects.filter(
+                country__member__population__range=(30_000_000, 70_000_000)
+            ),
+            [self.ottawa, self.paris],
+        )
+
+    def test_member(self):
+        self.assertCities(
+            City.objects.filter(country__member=CountryChoices.FRANCE), [self.paris]
+        )
+
+    def test_label(self):
+        self.assertCities(
+            City.objects.filter(country__label__icontains="fr"), [self.paris]
+        )
+        self.assertCities(
+            City.objects.filter(country__label__startswith="G"), [self.berlin]
+        )
+
+    def test_label_unhashable_members(self):
+        @dataclass
+        class Drink:
+            label: str
+
+        register = Register()
+        water = register.register(Drink("Water"), db_key="water")
+        register.register(Drink("Juice"), db_key="juice")
+        field = City._meta.get_field("available_food")
+
+        with mock.patch.object(field, "register", register):
+            self.paris.available_food = water
+            self.paris.save()
+
+            self.assertCities(
+                City.objects.filter(available_food__label="Water"), [self.paris]
+            )
+
+    def test_exclude(self):
+        self.assertCities(
+            City.objects.exclude(country__member__population__gt=50_000_000),
+            [self.ottawa],
+        )
+
+    def test_no_match(self):
+        self.assertCities(City.objects.filter(country__member__capital="Nowhere"), [])
+        self.assertCities(
+            City.objects.exclude(country__member__capital="Nowhere"),
+            [self.berlin, self.ottawa, self.paris],
+        )
+
+    def test_missing_attribute(self):
+        self.assertCities(
+            City.objects.filter(country__member__mayor__isnull=True),
+            [self.berlin, self.ottawa, self.paris],
+        )
+        self.assertCities(City.objects.filter(country__member__mayor="Max"), [])
+
+    def test_integer_field(self):
+        self.assertCities(
+            City.objects.filter(language__member__speakers__lt=200_000_000),
+            [self.berlin],
+        )
+
+    def test_through_relation(self):
+        Neighborhood.objects.create(name="Montparnasse", city=self.paris)
+        Neighborhood.objects.create(name="Glebe", city=self.ottawa)
+
+        self.assertEqual(
+            list(
+                Neighborhood.objects.filter(
+                    city__country__member__population__gt=50_000_000
+                ).values_list("name", flat=True)
+            ),
+            ["Montparnasse"],
+        )
+
+    def test_expression_rhs(self):
+        with self.assertRaises(ValueError):
+            list(City.objects.filter(country__member__capital=models.F("name")))
+
+    def test_transform_outside_filter(self):
+        with self.assertRaises(FieldError):
+            list(City.objects.values("country__member__capital"))
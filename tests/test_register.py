@@ -1,9 +1,18 @@
+# Standard libraries
+import warnings
+from dataclasses import dataclass
+
 # Django
 from django.forms import ValidationError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 # django_register
-from django_register.base import Register, UnknownRegisterItem
+from django_register.base import (
+    UNKNOWN_OTHER,
+    Register,
+    RegisterChoices,
+    UnknownRegisterItem,
+)
 from tests.models import CountryChoices, CountryInfo
 
 
@@ -62,6 +71,345 @@ class RegisterTestCase(TestCase):
             obj = self.register.get_class("unknown")
         self.assertIsInstance(obj, OtherUnknownItem)
 
+    def test_resolution_does_not_build_unknown_items(self):
+        class ExplodingUnknownItem:
+            def __init__(self):
+                raise AssertionError("The unknown item should not be built.")
+
+        register = Register(unknown_item_class=ExplodingUnknownItem)
+        country_info = CountryInfo(1, capital="Max City")
+        register.register(country_info, db_key="max_country")
+
+        self.assertEqual(register.get_class("max_country"), country_info)
+        self.assertEqual(register.get_class(country_info), country_info)
+        self.assertEqual(register.get_key("max_country"), "max_country")
+        self.assertEqual(register.get_key(country_info), "max_country")
+        self.assertIsNone(register.get_key(None))
+
+    def test_has_key_and_has_class(self):
+        self.assertTrue(self.register.has_key("canada"))
+        self.assertFalse(self.register.has_key("unknown"))
+        self.assertFalse(self.register.has_key(["unhashable"]))
+
+        self.assertTrue(self.register.has_class(CountryChoices.CANADA))
+        self.assertFalse(self.register.has_class("canada"))
+        self.assertFalse(self.register.has_class({"unhashable": True}))
+
+    def test_derived_views_are_cached_per_version(self):
+        register = Register()
+        register.register(CountryInfo(1, capital="Max City"), db_key="max_country")
+
+        choices = register.choices
+        flatchoices = register.flatchoices
+        self.assertIs(register.choices, choices)
+        self.assertIs(register.flatchoices, flatchoices)
+        self.assertEqual(register.max_length, 11)
+
+        version = register.version
+        register.register(CountryInfo(2, capital="Other City"), db_key="longer_country")
+
+        self.assertEqual(register.version, version + 1)
+        self.assertIsNot(register.choices, choices)
+        self.assertEqual(
+            register.choices,
+            (("max_country", "Max Country"), ("longer_country", "Longer Country")),
+        )
+        self.assertEqual(len(register.flatchoices), 2)
+        self.assertEqual(register.max_length, 14)
+
+    def test_register_ids(self):
+        register = Register()
+        canada = CountryInfo(1, capital="Ottawa")
+        france = CountryInfo(2, capital="Paris")
+        register.register(canada, db_key="canada", db_id=1)
+        register.register(france, db_key="france")
+
+        self.assertEqual(register.from_id(1), canada)
+        self.assertEqual(register.get_id(canada), 1)
+        self.assertEqual(register.get_id("canada"), 1)
+        self.assertEqual(register.get_id(1), 1)
+        self.assertTrue(register.has_id(1))
+        self.assertFalse(register.has_id(2))
+        self.assertEqual(register.id_choices, ((1, "Canada"),))
+
+        with self.assertRaises(ValidationError):
+            register.get_id(france)
+
+        with self.assertRaises(ValueError):
+            register.register(CountryInfo(3, capital="Berlin"), db_key="a", db_id=1)
+
+        with self.assertRaises(ValueError):
+            register.register(CountryInfo(3, capital="Berlin"), db_key="b", db_id="3")
+
+    def test_get_classes(self):
+        self.assertEqual(
+            self.register.get_classes(["canada", None, "france"]),
+            [CountryChoices.CANADA, None, CountryChoices.FRANCE],
+        )
+        self.assertEqual(
+            self.register.get_classes([CountryChoices.CANADA, "france"]),
+            [CountryChoices.CANADA, CountryChoices.FRANCE],
+        )
+        self.assertEqual(self.register.get_classes([]), [])
+
+        with self.assertWarns(UserWarning):
+            obj, canada = self.register.get_classes(["unknown", "canada"])
+        self.assertIsInstance(obj, UnknownRegisterItem)
+        self.assertEqual(canada, CountryChoices.CANADA)
+
+        unknown = object()
+        self.assertEqual(
+            list(self.register.iter_classes(iter(["canada", "unknown"]), unknown)),
+            [CountryChoices.CANADA, unknown],
+        )
+
+    def test_get_keys(self):
+        self.assertEqual(
+            self.register.get_keys([CountryChoices.CANADA, None, "france"]),
+            ["canada", None, "france"],
+        )
+        self.assertEqual(
+            self.register.get_keys(["canada", CountryChoices.FRANCE]),
+            ["canada", "france"],
+        )
+
+        wrong_country = CountryInfo(12, capital="Max Capital")
+        with self.assertRaises(ValidationError):
+            self.register.get_keys([CountryChoices.CANADA, wrong_country])
+
+        self.assertEqual(
+            self.register.get_keys([wrong_country, "canada"], unknown=None),
+            [None, "canada"],
+        )
+
+    def test_index_by(self):
+        register = Register()
+        canada = CountryInfo(37_742_154, capital="Ottawa")
+        france = CountryInfo(65_273_511, capital="Paris")
+        register.register(canada, db_key="canada")
+        register.index_by("capital")
+        register.register(france, db_key="france")
+
+        self.assertEqual(register.get_by("capital", "Ottawa"), canada)
+        self.assertEqual(register.get_by("capital", "Paris"), france)
+        self.assertIsNone(register.get_by("capital", "Berlin"))
+        self.assertEqual(register.get_by("capital", ["Berlin"], canada), canada)
+
+        with self.assertRaises(ValueError):
+            register.register(CountryInfo(1, capital="Paris"), db_key="other")
+        self.assertFalse(register.has_key("other"))
+
+        with self.assertRaises(ValueError):
+            register.get_by("population", 1)
+
+    def test_index_by_not_unique(self):
+        register = Register()
+        first = CountryInfo(1, capital="Same")
+        second = CountryInfo(2, capital="Same")
+        register.register(first, db_key="first")
+        register.register(second, db_key="second")
+
+        with self.assertRaises(ValueError):
+            register.index_by("capital")
+
+        register.index_by("capital", unique=False)
+        register.register(CountryInfo(3, capital="Other"), db_key="third")
+
+        self.assertEqual(register.get_by("capital", "Same"), (first, second))
+        self.assertEqual(len(register.get_by("capital", "Other")), 1)
+        self.assertEqual(register.get_by("capital", "Nowhere"), ())
+
+    def test_index_by_in_choices(self):
+        class IndexedChoices(RegisterChoices):
+            _INDEX_BY_ = ("capital",)
+
+            CANADA = CountryInfo(37_742_154, capital="Ottawa")
+            FRANCE = CountryInfo(65_273_511, capital="Paris")
+
+        self.assertEqual(
+            IndexedChoices.get_by("capital", "Paris"), IndexedChoices.FRANCE
+        )
+
+        class MultiIndexedChoices(RegisterChoices):
+            _INDEX_BY_ = {"capital": True, "population": False}
+
+            CANADA = CountryInfo(1, capital="Ottawa")
+            FRANCE = CountryInfo(1, capital="Paris")
+
+        self.assertEqual(
+            MultiIndexedChoices.get_by("population", 1),
+            (MultiIndexedChoices.CANADA, MultiIndexedChoices.FRANCE),
+        )
+
+    def test_unregister(self):
+        register = Register()
+        canada = CountryInfo(37_742_154, capital="Ottawa")
+        france = CountryInfo(65_273_511, capital="Paris")
+        germany = CountryInfo(83_783_942, capital="Berlin")
+        register.register(canada, db_key="canada", db_id=1)
+        register.register(france, db_key="france", db_id=2)
+        register.register(germany, db_key="germany")
+        register.index_by("capital")
+        register.index_by("population", unique=False)
+        self.assertEqual(len(register.choices), 3)
+
+        register.unregister("france")
+
+        self.assertFalse(register.has_key("france"))
+        self.assertFalse(register.has_class(france))
+        self.assertFalse(register.has_id(2))
+        self.assertIsNone(register.get_by("capital", "Paris"))
+        self.assertEqual(register.get_by("population", 65_273_511), ())
+        self.assertEqual(
+            register.choices, (("canada", "Canada"), ("germany", "Germany"))
+        )
+        with self.assertRaises(ValidationError):
+            register.get_key(france)
+        with self.assertWarns(UserWarning):
+            self.assertIsInstance(register.get_class("france"), UnknownRegisterItem)
+
+        with self.assertRaises(ValueError):
+            register.unregister("france")
+
+        register.register(france, db_key="fr", db_id=2)
+        self.assertEqual(register.get_key(france), "fr")
+        self.assertEqual(register.get_by("capital", "Paris"), france)
+
+    def test_unregister_lazy(self):
+        register = Register()
+        register.register_lazy("tests.lazy_members:FOO", db_key="foo", db_id=1)
+
+        register.unregister("foo")
+
+        self.assertFalse(register.has_key("foo"))
+        self.assertFalse(register.has_id(1))
+        self.assertEqual(register.choices, ())
+
+    def test_unknown_items_are_cached(self):
+        register = Register()
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            items = [register.get_class("stale") for _ in range(5)]
+
+        self.assertEqual(len(caught), 1)
+        self.assertTrue(all(item is items[0] for item in items))
+        self.assertEqual(register.unknown_counts["stale"], 5)
+
+        class OtherUnknownItem:
+            pass
+
+        register.unknown_item_class = OtherUnknownItem
+        with self.assertWarns(UserWarning):
+            self.assertIsInstance(register.get_class("stale"), OtherUnknownItem)
+
+    @override_settings(REGISTER_FIELD_UNKNOWN_CACHE_SIZE=2)
+    def test_unknown_items_cache_is_bounded(self):
+        register = Register()
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            first = register.get_class("first")
+            register.get_class("second")
+            register.get_class("third")
+            self.assertIsNot(register.get_class("first"), first)
+
+        # The evicted key was already warned about.
+        self.assertEqual(len(caught), 3)
+        self.assertEqual(len(register._unknown_items), 2)
+
+    def test_unknown_warnings_survive_eviction(self):
+        register = Register()
+        keys = [f"stale_{i}" for i in range(200)]
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            for _ in range(10):
+                for key in keys:
+                    register.get_class(key)
+
+        self.assertEqual(len(caught), 200)
+        self.assertEqual(register.unknown_counts["stale_0"], 10)
+
+    @override_settings(REGISTER_FIELD_UNKNOWN_TRACKED_KEYS=2)
+    def test_unknown_tracking_is_bounded(self):
+        register = Register()
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            for key in ["a", "b", "c", "d", "a", "c"]:
+                register.get_class(key)
+
+        self.assertEqual(len(caught), 3)
+        self.assertEqual(register.unknown_counts, {"a": 2, "b": 1, UNKNOWN_OTHER: 3})
+
+    @override_settings(REGISTER_FIELD_UNKNOWN_WARNING_INTERVAL=0)
+    def test_unknown_items_warning_interval(self):
+        register = Register()
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            first = register.get_class("stale")
+            self.assertIs(register.get_class("stale"), first)
+
+        self.assertEqual(len(caught), 2)
+
+    def test_identity_lookups_do_not_hash(self):
+        class Member:
+            hashes = 0
+
+            def __init__(self, name):
+                self.name = name
+
+            def __hash__(self):
+                Member.hashes += 1
+                return hash(self.name)
+
+            def __eq__(self, other):
+                return isinstance(other, Member) and self.name == other.name
+
+        register = Register()
+        member = Member("a")
+        register.register(member, db_key="a", db_id=1)
+        Member.hashes = 0
+
+        self.assertEqual(register.get_key(member), "a")
+        self.assertEqual(register.get_class(member), member)
+        self.assertEqual(register.get_id(member), 1)
+        self.assertTrue(register.has_class(member))
+        self.assertEqual(register.get_keys([member, member]), ["a", "a"])
+        self.assertEqual(Member.hashes, 0)
+
+        # An equal copy is still found, by hash and equality.
+        self.assertEqual(register.get_key(Member("a")), "a")
+
+    def test_unhashable_members(self):
+        @dataclass
+        class Member:
+            name: str
+
+        register = Register()
+        member = Member("a")
+        register.register(member, db_key="a", db_id=1)
+
+        self.assertEqual(register.get_key(member), "a")
+        self.assertIs(register.get_class(member), member)
+        self.assertIs(register.get_class("a"), member)
+        self.assertEqual(register.get_id(member), 1)
+        self.assertEqual(register.get_classes([member, "a"]), [member, member])
+        self.assertEqual(register.choices, (("a", "A"),))
+
+        with self.assertRaises(ValueError):
+            register.register(member, db_key="b")
+
+        # Equal copies cannot be hashed, so only the registered object is known.
+        self.assertFalse(register.has_class(Member("a")))
+        with self.assertRaises(ValidationError):
+            register.get_key(Member("a"))
+
+        register.unregister("a")
+        self.assertFalse(register.has_class(member))
+
 
 class RegisterWithDecoratorTestCase(TestCase):
     @classmethod
@@ -1,3 +1,6 @@
+# Standard libraries
+from unittest import mock
+
 # Django
 from django.test import TestCase
 
@@ -5,8 +8,9 @@ from django.test import TestCase
 from rest_framework import serializers
 
 # django_register
-from django_register.rest_framework import RegisterField
-from tests.models import City, CountryChoices
+from django_register import Register
+from django_register.rest_framework import RegisterField, RegisterListSerializer
+from tests.models import City, CountryChoices, CountryInfo
 
 
 class CitySerialier(serializers.ModelSerializer):
@@ -17,6 +21,15 @@ class CitySerialier(serializers.ModelSerializer):
         fields = ("name", "country")
 
 
+class CityListSerializer(serializers.ModelSerializer):
+    country = RegisterField()
+
+    class Meta:
+        model = City
+        fields = ("name", "country")
+        list_serializer_class = RegisterListSerializer
+
+
 class RegisterSerializerTestCase(TestCase):
     @classmethod
     def setUpTestData(cls) -> None:
@@ -76,3 +89,127 @@ class RegisterSerializerTestCase(TestCase):
                 },
             },
         )
+
+    def test_keys_representation_is_cached(self):
+        field = RegisterField(
+            register=CountryChoices.register, keys=["key", "label", "capital"]
+        )
+
+        first = field.to_representation(CountryChoices.FRANCE)
+        first["capital"] = "Lyon"
+        second = field.to_representation(CountryChoices.FRANCE)
+
+        self.assertEqual(
+            second, {"key": "france", "label": "France", "capital": "Paris"}
+        )
+        self.assertIsNot(first, second)
+        self.assertIn(
+            id(CountryChoices.FRANCE),
+            CountryChoices.register._cached(("representation", field.keys), dict),
+        )
+
+    def test_keys_representation_follows_register(self):
+        register = Register()
+        canada = CountryInfo(population=37_742_154, capital="Ottawa")
+        register.register(canada, db_key="canada")
+        field = RegisterField(register=register, keys=["key", "label"])
+
+        self.assertEqual(
+            field.to_representation(canada), {"key": "canada", "label": "Canada"}
+        )
+
+        register.unregister("canada")
+        register.register(canada, db_key="ca")
+
+        self.assertEqual(field.to_representation(canada), {"key": "ca", "label": "Ca"})
+
+    def test_many_representation(self):
+        class CitySerializer(serializers.ModelSerializer):
+            country = RegisterField(keys=["key", "capital"])
+
+            class Meta:
+                model = City
+                fields = ("name", "country")
+
+        City.objects.create(name="Lyon", country=CountryChoices.FRANCE)
+        serializer = CitySerializer(City.objects.order_by("name"), many=True)
+
+        self.assertEqual(
+            [city["country"] for city in serializer.data],
+            [{"key": "france", "capital": "Paris"}] * 2,
+        )
+
+    def test_value_resolved_once(self):
+        serializer = CitySerialier(data={"name": "Paris", "country": "france"})
+        register = CountryChoices.register
+
+        with mock.patch.object(
+            register, "get_class", wraps=register.get_class
+        ) as get_class:
+            self.assertTrue(serializer.is_valid())
+
+        get_class.assert_called_once_with("france")
+        self.assertEqual(serializer.validated_data["country"], CountryChoices.FRANCE)
+
+
+class RegisterListSerializerTestCase(TestCase):
+    def test_bulk_validation(self):
+        data = [
+            {"name": "Paris", "country": "france"},
+            {"name": "Lyon", "country": "france"},
+            {"name": "Berlin", "country": CountryChoices.GERMANY},
+        ]
+        serializer = CityListSerializer(data=data, many=True)
+        register = CountryChoices.register
+
+        with mock.patch.object(register, "get_class") as get_class:
+            self.assertTrue(serializer.is_valid())
+
+        get_class.assert_not_called()
+        self.assertEqual(
+            [city["country"] for city in serializer.validated_data],
+            [CountryChoices.FRANCE, CountryChoices.FRANCE, CountryChoices.GERMANY],
+        )
+
+        cities = serializer.save()
+        self.assertEqual(cities[2].country, CountryChoices.GERMANY)
+
+    def test_bulk_validation_unknown_keys(self):
+        data = [
+            {"name": "Paris", "country": "francis"},
+            {"name": "Lyon", "country": "france"},
+            {"name": "Berlin", "country": "germania"},
+            {"name": "Nice", "country": "francis"},
+        ]
+        serializer = CityListSerializer(data=data, many=True)
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            serializer.errors,
+            {
+                "country": [
+                    "Value francis not a registered key.",
+                    "Value germania not a registered key.",
+                ]
+            },
+        )
+
+    def test_bulk_validation_other_errors(self):
+        serializer = CityListSerializer(
+            data=[{"name": "Paris", "country": "france"}, {"country": "france"}],
+            many=True,
+        )
+
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("name", serializer.errors[1])
+
+    def test_memo_follows_register(self):
+        register = Register()
+        register.register(CountryChoices.FRANCE, db_key="france")
+        field = RegisterField(register=register)
+
+        self.assertEqual(field.prime(["france", "spain"]), ["spain"])
+        self.assertEqual(field._resolved, {"france": CountryChoices.FRANCE})
+
+        register.register(CountryChoices.GERMANY, db_key="germany")
+        self.assertEqual(field._get_resolved(), {})
@@ -0,0 +1,140 @@
+# Django
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+
+# django_register
+from django_register import RegisterSetField
+from tests.models import City, CountryChoices, LanguageChoices
+
+
+class CityForm(forms.ModelForm):
+    class Meta:
+        model = City
+        fields = ("name", "spoken_languages")
+
+
+class RegisterSetFieldTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.ottawa = City.objects.create(
+            name="Ottawa",
+            country=CountryChoices.CANADA,
+            spoken_languages={LanguageChoices.ENGLISH, LanguageChoices.FRENCH},
+        )
+        cls.berlin = City.objects.create(
+            name="Berlin",
+            country=CountryChoices.GERMANY,
+            spoken_languages={LanguageChoices.GERMAN},
+        )
+        cls.paris = City.objects.create(name="Paris", country=CountryChoices.FRANCE)
+
+    def test_stores_a_bitmask(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT spoken_languages FROM tests_city WHERE id = %s",
+                [self.ottawa.pk],
+            )
+            self.assertEqual(cursor.fetchone(), (0b110,))
+
+        self.ottawa.refresh_from_db()
+        self.assertEqual(
+            self.ottawa.spoken_languages,
+            frozenset({LanguageChoices.ENGLISH, LanguageChoices.FRENCH}),
+        )
+
+    def test_default(self):
+        self.paris.refresh_from_db()
+        self.assertEqual(self.paris.spoken_languages, frozenset())
+        self.assertEqual(City().spoken_languages, frozenset())
+
+    def test_exact(self):
+        self.assertEqual(
+            City.objects.get(spoken_languages={LanguageChoices.GERMAN}), self.berlin
+        )
+        self.assertEqual(City.objects.get(spoken_languages=frozenset()), self.paris)
+
+    def test_contains(self):
+        self.assertEqual(
+            list(
+                City.objects.filter(spoken_languages__contains=LanguageChoices.FRENCH)
+            ),
+            [self.ottawa],
+        )
+        self.assertEqual(
+            list(City.objects.filter(spoken_languages__contains="german")),
+            [self.berlin],
+        )
+
+    def test_contains_all(self):
+        self.assertEqual(
+            list(
+                City.objects.filter(
+                    spoken_languages__contains_all=[
+                        LanguageChoices.ENGLISH,
+                        LanguageChoices.FRENCH,
+                    ]
+                )
+            ),
+            [self.ottawa],
+        )
+        self.assertFalse(
+            City.objects.filter(
+                spoken_languages__contains_all=[
+                    LanguageChoices.ENGLISH,
+                    LanguageChoices.GERMAN,
+                ]
+            ).exists()
+        )
+
+    def test_contains_any(self):
+        self.assertEqual(
+            list(
+                City.objects.filter(
+                    spoken_languages__contains_any=[
+                        LanguageChoices.FRENCH,
+                        LanguageChoices.GERMAN,
+                    ]
+                ).order_by("name")
+            ),
+            [self.berlin, self.ottawa],
+        )
+        self.assertEqual(
+            list(
+                City.objects.exclude(
+                    spoken_languages__contains_any=[LanguageChoices.GERMAN]
+                ).order_by("name")
+            ),
+            [self.ottawa, self.paris],
+        )
+
+    def test_member_without_valid_id(self):
+        field = RegisterSetField(choices=CountryChoices)
+
+        with self.assertRaises(ValidationError):
+            field.get_prep_value({CountryChoices.FRANCE})
+
+    def test_form(self):
+        form = CityForm(instance=self.ottawa)
+        self.assertEqual(
+            sorted(form.initial["spoken_languages"]), ["english", "french"]
+        )
+
+        form = CityForm(
+            data={"name": "Ottawa", "spoken_languages": ["german"]},
+            instance=self.ottawa,
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        city = form.save()
+
+        city.refresh_from_db()
+        self.assertEqual(city.spoken_languages, frozenset({LanguageChoices.GERMAN}))
+
+    def test_deconstruct(self):
+        field = City._meta.get_field("spoken_languages")
+        name, path, args, kwargs = field.deconstruct()
+
+        self.assertEqual(path, "django_register.base.RegisterSetField")
+        self.assertEqual(kwargs["default"], 0)
+        self.assertIs(kwargs["register"], LanguageChoices.register)
@@ -285,3 +285,29 @@ class SettingsTestCase(TestCase):
         representation = field.to_representation(ProductChoices.LAPTOP)
         expected = {"name": "lpt", "pretty_name": "Laptop Computer", "price": 999.99}
         self.assertEqual(representation, expected)
+
+    def test_settings_are_resolved_once(self):
+        settings.KEY_NAME
+        self.assertEqual(settings.__dict__["KEY_NAME"], "key")
+
+        with override_settings(REGISTER_FIELD_KEY_NAME="name"):
+            self.assertNotIn("KEY_NAME", settings.__dict__)
+            self.assertEqual(settings.KEY_NAME, "name")
+
+        self.assertEqual(settings.KEY_NAME, "key")
+
+    def test_register_caches_follow_settings_changes(self):
+        @dataclass(unsafe_hash=True)
+        class Item:
+            key: str
+            label: str
+            pretty_name: str
+
+        register = Register()
+        register.register(Item(key="a", label="Label", pretty_name="Pretty"))
+        self.assertEqual(register.choices, (("a", "Label"),))
+
+        with override_settings(REGISTER_FIELD_LABEL_NAME="pretty_name"):
+            self.assertEqual(register.choices, (("a", "Pretty"),))
+
+        self.assertEqual(register.choices, (("a", "Label"),))
@@ -0,0 +1,120 @@
+# Django
+from django.test import TestCase
+
+# django_register
+from django_register import stats
+from django_register.base import Register, UnknownRegisterItem
+from tests.models import City, CountryChoices, CountryInfo, LanguageChoices
+
+
+class RegisterStatsTestCase(TestCase):
+    def setUp(self):
+        self.register = Register()
+        self.canada = CountryInfo(population=37_742_154, capital="Ottawa")
+        self.register.register(self.canada, db_key="canada", db_id=1)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.register.stats())
+        self.assertNotIn("get_class", self.register.__dict__)
+
+    def test_lookup_counters(self):
+        self.register.enable_stats()
+        self.addCleanup(self.register.disable_stats)
+
+        self.register.get_class("canada")
+        self.register.get_class(self.canada)
+        self.register.get_key(self.canada)
+        self.register.from_id(1)
+        self.register.from_key("spain", ignore_warning=True)
+        with self.assertWarns(UserWarning):
+            self.register.get_class("spain")
+
+        stats = self.register.stats()
+        self.assertEqual(stats["key_hits"], 2)
+        self.assertEqual(stats["object_hits"], 2)
+        self.assertEqual(stats["unknown_misses"], {"spain": 2})
+
+    def test_disable_keeps_stats(self):
+        self.register.enable_stats()
+        self.register.get_class("canada")
+        self.register.disable_stats()
+
+        self.assertNotIn("get_class", self.register.__dict__)
+        self.register.get_class("canada")
+        self.assertEqual(self.register.stats()["key_hits"], 1)
+
+        self.register.enable_stats()
+        self.addCleanup(self.register.disable_stats)
+        self.assertEqual(self.register.stats()["key_hits"], 0)
+
+    def test_callback(self):
+        calls = []
+        self.register.enable_stats(callback=lambda **kwargs: calls.append(kwargs))
+        self.addCleanup(self.register.disable_stats)
+
+        self.register.get_class("canada")
+        self.register.from_key("spain", ignore_warning=True)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0]["method"], "from_key")
+        self.assertEqual(calls[0]["value"], "spain")
+        self.assertTrue(calls[0]["unknown"])
+        self.assertIs(calls[0]["register"], self.register)
+
+    def test_callback_slow_threshold_and_sampling(self):
+        calls = []
+        self.register.enable_stats(
+            callback=lambda **kwargs: calls.append(kwargs), slow_threshold=0
+        )
+        self.register.get_class("canada")
+        self.assertEqual(len(calls), 1)
+        self.assertFalse(calls[0]["unknown"])
+
+        self.register.enable_stats(
+            callback=lambda **kwargs: calls.append(kwargs),
+            slow_threshold=0,
+            sample_rate=0,
+        )
+        self.addCleanup(self.register.disable_stats)
+        self.register.get_class("canada")
+        self.assertEqual(len(calls), 1)
+
+    def test_aggregate(self):
+        other = Register()
+        other.register(UnknownRegisterItem(), db_key="other")
+
+        self.register.enable_stats()
+        other.enable_stats()
+        self.addCleanup(self.register.disable_stats)
+        self.addCleanup(other.disable_stats)
+
+        self.register.get_class("canada")
+        other.get_class("other")
+        other.from_key("spain", ignore_warning=True)
+
+        total = stats.aggregate()
+        self.assertGreaterEqual(total["key_hits"], 2)
+        self.assertGreaterEqual(total["unknown_misses"]["spain"], 1)
+
+
+class FieldStatsTestCase(TestCase):
+    def test_field_conversions_are_timed(self):
+        for register in (CountryChoices.register, LanguageChoices.register):
+            register.enable_stats()
+            self.addCleanup(register.disable_stats)
+
+        City.objects.create(
+            name="Paris", country=CountryChoices.FRANCE, language=LanguageChoices.FRENCH
+        )
+        list(City.objects.all())
+
+        country = CountryChoices.register.stats()
+        self.assertGreaterEqual(country["get_prep_value"]["calls"], 1)
+        self.assertEqual(country["from_db_value"]["calls"], 1)
+        self.assertGreater(country["from_db_value"]["time"], 0)
+        # Both language and spoken_languages use the register.
+        self.assertEqual(LanguageChoices.register.stats()["from_db_value"]["calls"], 2)
+
+        field = City._meta.get_field("country")
+        CountryChoices.register.disable_stats()
+        self.assertNotIn("from_db_value", field.__dict__)
@@ -0,0 +1,152 @@
+# Standard libraries
+import sys
+import threading
+import warnings
+from dataclasses import dataclass
+from unittest import mock
+
+# Django
+from django.test import SimpleTestCase
+
+# django_register
+from django_register.base import Register
+
+
+@dataclass(unsafe_hash=True)
+class Item:
+    key: str
+
+
+class LazyItems:
+    pass
+
+
+for i in range(500):
+    setattr(LazyItems, f"item_{i}", Item(f"item_{i}"))
+
+
+class ConcurrentRegisterTestCase(SimpleTestCase):
+    def setUp(self):
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+    def _run(self, *targets):
+        errors = []
+
+        def run(target):
+            try:
+                target()
+            except BaseException as err:  # noqa: B036
+                errors.append(err)
+
+        threads = [threading.Thread(target=run, args=(target,)) for target in targets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+    def test_readers_see_complete_registrations(self):
+        register = Register()
+        registered = []
+        done = threading.Event()
+
+        def write():
+            for i in range(2_000):
+                item = register.register(Item(f"item_{i}"))
+                registered.append(item)
+            done.set()
+
+        def read():
+            while not done.is_set():
+                snapshot = register._snapshot
+                self.assertEqual(len(snapshot.key_to_class), len(snapshot.class_to_key))
+
+                if registered:
+                    item = registered[-1]
+                    self.assertIs(register.get_class(item.key), item)
+                    self.assertEqual(register.get_key(item), item.key)
+
+                choices = register.choices
+                self.assertEqual(len(choices), len(set(choices)))
+
+        self._run(write, read, read, read)
+
+    def test_concurrent_writers(self):
+        register = Register()
+        register.index_by("key")
+
+        def write(thread):
+            for i in range(500):
+                register.register(Item(f"item_{thread}_{i}"))
+
+        self._run(*(lambda t=t: write(t) for t in range(4)))
+
+        self.assertEqual(len(register._key_to_class), 2_000)
+        self.assertEqual(len(register._class_to_key), 2_000)
+        self.assertEqual(len(register._indexes["key"][1]), 2_000)
+        self.assertEqual(register.get_by("key", "item_3_499").key, "item_3_499")
+
+    def test_concurrent_lazy_resolution(self):
+        register = Register()
+        for i in range(500):
+            register.register_lazy(f"{__name__}:LazyItems.item_{i}", f"item_{i}")
+
+        def read():
+            for i in range(500):
+                item = register.get_class(f"item_{i}")
+                self.assertIs(item, getattr(LazyItems, f"item_{i}"))
+
+        self._run(read, read, read, read)
+
+        self.assertFalse(register._lazy)
+        self.assertEqual(len(register._key_to_class), 500)
+
+    def test_lazy_key_resolved_by_another_thread(self):
+        register = Register()
+        register.register_lazy(f"{__name__}:LazyItems.item_0", "item_0")
+        resolve_lazy = register._resolve_lazy
+
+        def resolve_elsewhere(key, *args):
+            # Another thread resolves the key between its lookup and its
+            # resolution by this one.
+            self._run(lambda: resolve_lazy(key))
+            return resolve_lazy(key, *args)
+
+        with mock.patch.object(register, "_resolve_lazy", resolve_elsewhere):
+            self.assertIs(register.get_class("item_0"), LazyItems.item_0)
+
+    def test_concurrent_unknown_items(self):
+        register = Register()
+
+        def read():
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                for i in range(2_000):
+                    register.from_key(f"unknown_{i % 300}")
+
+        self._run(read, read, read, read)
+
+        self.assertEqual(sum(register.unknown_counts.values()), 8_000)
+
+    def test_batch(self):
+        register = Register()
+
+        with register.batch():
+            register.register(Item("a"))
+            register.register(Item("b"))
+            # Published when the block exits.
+            self.assertFalse(register.has_key("a"))
+
+        self.assertEqual(register.get_keys([Item("a"), Item("b")]), ["a", "b"])
+        self.assertEqual(register.version, 1)
+
+        with self.assertRaises(ValueError):
+            with register.batch():
+                register.register(Item("c"))
+                register.register(Item("a"))
+
+        self.assertFalse(register.has_key("c"))